@@ -1,10 +1,49 @@
-if __name__ == '__main__':
-    # file with instructions
-    file_path = '../instructions.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
+import os
+import sys
+
+
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import read_lines
+from aoc.instrumentation import count
+
+# file with instructions
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'instructions.txt')
+
+
+def parse(file_path: str) -> list[tuple[int, int]]:
+    """
+    Parse file into list of instructions, each given by the value added to register X
+    and the number of cycles taken.
+    """
+    instructions = []
+    for line in read_lines(file_path):
+        line_split = line.split()
+        instruction = line_split[0]
+
+        # single cycle instruction where X is unchanged
+        if instruction == 'noop':
+            V = 0
+            n_cycles = 1
+        # double cycle instruction where X is changed
+        elif instruction == 'addx':
+            V = int(line_split[1])
+            n_cycles = 2
+        else:
+            raise ValueError(f'encountered unknown instruction {instruction}')
+
+        instructions.append((V, n_cycles))
 
+    return instructions
+
+
+def run_instructions(instructions: list[tuple[int, int]]) -> tuple[int, list[str]]:
+    """
+    Run instructions and get signal strength and rows drawn by CRT.
+    """
     # current cycle
     cycle = 0
     # register
@@ -19,22 +58,10 @@ if __name__ == '__main__':
     sprite_length = 3
     # initialize row of pixels
     row = [' '] * screen_length
+    # list of drawn rows
+    rows = []
 
-    for line in file_contents.splitlines():
-        line_split = line.split()
-        instruction = line_split[0]
-    
-        # single cycle instruction where X is unchanged
-        if instruction == 'noop':
-            V = 0
-            n_cycles = 1
-        # double cycle instruction where X is changed
-        elif instruction == 'addx':
-            V = int(line_split[1])
-            n_cycles = 2
-        else:
-            raise ValueError(f'encountered unknown instruction {instruction}')
-
+    for V, n_cycles in instructions:
         # iterate over cycles
         for _ in range(n_cycles):
             # increment cycle count
@@ -53,12 +80,33 @@ if __name__ == '__main__':
             i += 1
             # if reached end of row
             if i == screen_length:
-                # print row
-                print(''.join(row))
+                # store row
+                rows.append(''.join(row))
                 # reset writing position and row
                 i = 0
 
         # update register X
         X += V
 
-    print(signal_strength)
+    count('cycles', cycle)
+
+    return signal_strength, rows
+
+
+def part1(instructions: list[tuple[int, int]]) -> int:
+    signal_strength, _ = run_instructions(instructions)
+
+    return signal_strength
+
+
+def part2(instructions: list[tuple[int, int]]) -> str:
+    _, rows = run_instructions(instructions)
+
+    return '\n'.join(rows)
+
+
+if __name__ == '__main__':
+    instructions = parse(INPUT_FILE_PATH)
+
+    print(part1(instructions))
+    print(part2(instructions))
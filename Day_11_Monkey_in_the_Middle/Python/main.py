@@ -1,7 +1,21 @@
+import os
+import sys
 import re
 import heapq
 from math import lcm
-from typing import List, Tuple, Callable
+from typing import Any, Dict, List, Tuple, Callable
+
+
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import read_records
+from aoc.instrumentation import count
+
+# file with monkeys input data
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'monkeys.txt')
 
 
 # class representing monkey
@@ -104,13 +118,11 @@ class MonkeysManager:
         return inspections_product
 
 
-if __name__ == '__main__':
-    # file with monkeys input data
-    file_path = '../monkeys.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
-
+def parse(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Parse file into list of monkey descriptions. Operations are kept as expression
+    strings of "old", so parsed monkeys can be reused to create fresh Monkey objects.
+    """
     # regex pattern for parsing starting items
     regex_starting_items = re.compile(r'^\s*Starting items:\s*(.+)$')
     # regex pattern for parsing operation
@@ -122,23 +134,18 @@ if __name__ == '__main__':
     # regex pattern for parsing monkey to throw to if indivisible
     regex_indivisible_throw_to = re.compile(r'^\s*If\s*false:\s*throw\s*to\s*monkey\s*(\d+)$')
 
-    monkeys_manager = MonkeysManager()
-    # list of divisors
-    divisors = []
-
-    for monkey_input in file_contents.split('\n\n'):
-        lines = monkey_input.splitlines()
+    monkeys_data = []
 
+    for lines in read_records(file_path):
         # parse monkey infos
         result = regex_starting_items.search(lines[1])
         starting_items = [int(i.strip()) for i in result.group(1).split(',')]
 
         result = regex_operation.search(lines[2])
-        operation = eval(f'lambda old: {result.group(1)}')
+        operation = result.group(1)
 
         result = regex_divisor.search(lines[3])
         divisor = int(result.group(1))
-        divisors.append(divisor)
 
         result = regex_divisible_throw_to.search(lines[4])
         divisible_throw_to = int(result.group(1))
@@ -146,27 +153,71 @@ if __name__ == '__main__':
         result = regex_indivisible_throw_to.search(lines[5])
         indivisible_throw_to = int(result.group(1))
 
+        monkeys_data.append({
+            'items': starting_items,
+            'operation': operation,
+            'divisor': divisor,
+            'divisible_throw_to': divisible_throw_to,
+            'indivisible_throw_to': indivisible_throw_to,
+        })
+
+    return monkeys_data
+
+
+def create_monkeys_manager(monkeys_data: List[Dict[str, Any]]) -> MonkeysManager:
+    """
+    Create monkeys manager with fresh monkeys from parsed monkey descriptions.
+    """
+    monkeys_manager = MonkeysManager()
+
+    for monkey_data in monkeys_data:
         # create and add monkey to monkeys manager
         monkey = Monkey(
-            items=starting_items,
-            operation=operation,
-            divisor=divisor,
-            divisible_throw_to=divisible_throw_to,
-            indivisible_throw_to=indivisible_throw_to,
+            items=list(monkey_data['items']),
+            operation=eval(f'lambda old: {monkey_data["operation"]}'),
+            divisor=monkey_data['divisor'],
+            divisible_throw_to=monkey_data['divisible_throw_to'],
+            indivisible_throw_to=monkey_data['indivisible_throw_to'],
         )
         monkeys_manager.add_monkey(monkey)
 
-    # compute worry management function
-    # worry_manager = lambda x: x // 3
-    divisors_lcm = lcm(*divisors)
-    worry_manager = lambda x: x % divisors_lcm
+    return monkeys_manager
+
+
+def monkey_business_after_rounds(
+    monkeys_data: List[Dict[str, Any]],
+    worry_manager: Callable[[int], int],
+    n_rounds: int,
+) -> int:
+    """
+    Run inspection rounds and compute monkey business using top-2 inspection counts.
+    """
+    monkeys_manager = create_monkeys_manager(monkeys_data)
     monkeys_manager.set_worry_manager(worry_manager)
 
     # run inspection rounds
-    # n_rounds = 20
-    n_rounds = 10000
     for r in range(n_rounds):
         monkeys_manager.run_inspection_round()
 
-    # compute and print monkey business using top-2 inspection counts
-    print(monkeys_manager.monkey_business(2))
+    count('rounds', n_rounds)
+    count('inspections', sum([monkey.inspection_count for monkey in monkeys_manager.monkeys]))
+
+    return monkeys_manager.monkey_business(2)
+
+
+def part1(monkeys_data: List[Dict[str, Any]]) -> int:
+    return monkey_business_after_rounds(monkeys_data, lambda x: x // 3, 20)
+
+
+def part2(monkeys_data: List[Dict[str, Any]]) -> int:
+    # compute worry management function
+    divisors_lcm = lcm(*[monkey_data['divisor'] for monkey_data in monkeys_data])
+
+    return monkey_business_after_rounds(monkeys_data, lambda x: x % divisors_lcm, 10000)
+
+
+if __name__ == '__main__':
+    monkeys_data = parse(INPUT_FILE_PATH)
+
+    print(part1(monkeys_data))
+    print(part2(monkeys_data))
@@ -1,13 +1,29 @@
+import os
+import sys
 import itertools
 from functools import cmp_to_key
 from typing import List, Any
 
 
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import read_records
+from aoc.instrumentation import count
+
+# file with signals data
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'signals.txt')
+
+
 def compare_packets(v1: int | List[Any], v2: int | List[Any]):
     """
     Compare two given packets recursively. True means v1 comes before v2, False means v1
     comes after v2. None means v1 and v2 are equivalent.
     """
+    count('compare_packets_calls')
+
     # if both integers, perform integer comparison
     if isinstance(v1, int) and isinstance(v2, int):
         if v1 == v2:
@@ -51,24 +67,29 @@ def compare_packets(v1: int | List[Any], v2: int | List[Any]):
 
     return default_return
 
-if __name__ == '__main__':
-    # file with signals data
-    file_path = '../signals.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
 
+def parse(file_path: str) -> List[List[Any]]:
+    """
+    Parse file into list of pairs of packets.
+    """
     # list of pairs of packets
-    packet_pairs = [[eval(packet) for packet in pair.splitlines()] for pair in file_contents.split('\n\n')]
+    packet_pairs = [[eval(packet) for packet in pair] for pair in read_records(file_path)]
+    count('packets', 2 * len(packet_pairs))
 
+    return packet_pairs
+
+
+def part1(packet_pairs: List[List[Any]]) -> int:
     indices_sum = 0
     # iterate over packet pairs, compare pair, and update sum of indices
     for i, packet_pair in enumerate(packet_pairs):
         if compare_packets(*packet_pair):
             indices_sum += i + 1
 
-    print(indices_sum)
+    return indices_sum
 
+
+def part2(packet_pairs: List[List[Any]]) -> int:
     # flatten list of packets pairs to get list of packets
     packets = list(itertools.chain(*packet_pairs))
     # add divider packets
@@ -87,4 +108,11 @@ if __name__ == '__main__':
         if packet == [[2]] or packet == [[6]]:
             indices_prod *= (i + 1)
 
-    print(indices_prod)
+    return indices_prod
+
+
+if __name__ == '__main__':
+    packet_pairs = parse(INPUT_FILE_PATH)
+
+    print(part1(packet_pairs))
+    print(part2(packet_pairs))
@@ -1,7 +1,29 @@
-import numpy as np
+from __future__ import annotations
+
+import os
+import sys
 from typing import List, Tuple
 
 
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import read_lines
+from aoc.grid import render, shift
+from aoc.instrumentation import count as record_count
+from aoc.lazy import lazy_import
+
+# numpy is only imported once a solution first uses it
+np = lazy_import('numpy')
+
+# file with rocks data
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'rocks.txt')
+# horizontal coordinate sand is poured from
+SAND_J = 500
+
+
 # exception used specifically to signal a termination in pouring sand
 class SandPouringError(BaseException):
     pass
@@ -151,10 +173,40 @@ class Cave:
 
         return sand_ij
 
+    def fill_sand_infinite_floor(self) -> int:
+        """
+        Fill cave with sand in infinite_floor mode and return number of particles.
+        With a floor, every particle eventually settles, so the cave ends up with sand
+        in exactly the air cells reachable from the source by moving down, down-left
+        or down-right. These are found one row at a time from the row above.
+        """
+        air = self.cave == self.AIR
+        # mask of cells sand can reach in current row
+        reachable = np.zeros(self.cave.shape[1], dtype=np.bool_)
+        reachable[self.sand_j] = air[0, self.sand_j]
+        self.cave[0][reachable] = self.SAND
+        # number of sand particles filled
+        count = int(reachable.sum())
+
+        for i in range(1, self.cave.shape[0]):
+            reachable = (reachable | shift(reachable, (-1,), fill=False) | shift(reachable, (1,), fill=False)) & air[i]
+            self.cave[i][reachable] = self.SAND
+            count += int(reachable.sum())
+
+        return count
+
     def pour_sand_till_filled(self):
         """
         Keep pouring sand particles until filled and return number of particles poured.
         """
+        # filling with a floor doesn't need particle by particle simulation
+        if self.mode == 'infinite_floor':
+            count = self.fill_sand_infinite_floor()
+            record_count('grains', count)
+            record_count('cave_cells', self.cave.size)
+
+            return count
+
         # number of sand particles poured
         count = 0
         while True:
@@ -172,6 +224,9 @@ class Cave:
             except SandPouringError:
                 break
 
+        record_count('grains', count)
+        record_count('cave_cells', self.cave.size)
+
         return count
 
     def __str__(self):
@@ -184,33 +239,40 @@ class Cave:
             self.SAND: 'o',
         }
 
-        rows = []
-        for i in range(self.cave.shape[0]):
-            row = []
-            for j in range(self.cave.shape[1]):
-                row.append(chars[self.cave[i, j]])
-
-            rows.append(''.join(row))
-
-        return '\n'.join(rows)
+        return render(self.cave, chars)
 
     def __repr__(self):
         return self.__str__()
 
 
-if __name__ == '__main__':
-    sand_j = 500
-    # file with rocks data
-    file_path = '../rocks.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
-
+def parse(file_path: str) -> List[List[Tuple[int, int]]]:
+    """
+    Parse file into list of rock paths.
+    """
     # parse rock paths
     rocks = []
-    for line in file_contents.splitlines():
+    for line in read_lines(file_path):
         rocks.append([tuple(int(i) for i in ij.split(',')) for ij in line.split('->')])
 
+    return rocks
+
+
+def part1(rocks: List[List[Tuple[int, int]]]) -> int:
     # create cave and pour sand till filled
-    cave = Cave(rocks, sand_j, 'infinite_floor')
-    print(cave.pour_sand_till_filled())
\ No newline at end of file
+    cave = Cave(rocks, SAND_J, 'abyss')
+
+    return cave.pour_sand_till_filled()
+
+
+def part2(rocks: List[List[Tuple[int, int]]]) -> int:
+    # create cave and pour sand till filled
+    cave = Cave(rocks, SAND_J, 'infinite_floor')
+
+    return cave.pour_sand_till_filled()
+
+
+if __name__ == '__main__':
+    rocks = parse(INPUT_FILE_PATH)
+
+    print(part1(rocks))
+    print(part2(rocks))
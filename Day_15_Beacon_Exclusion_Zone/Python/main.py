@@ -1,6 +1,28 @@
+import os
+import sys
 import re
 
 
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import read_lines
+from aoc.instrumentation import count as record_count
+
+# file with sensors and beacons data
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'sensors_and_beacons.txt')
+# row to count beacon exclusion points in
+# EXCLUSION_ROW_Y = 10
+EXCLUSION_ROW_Y = 2000000
+# range of coordinates the distress beacon can be located in
+# ALLOWED_RANGE = (0, 20)
+ALLOWED_RANGE = (0, 4000000)
+# constant for finding tuning frequency
+TUNING_FREQUENCY_CONSTANT = 4000000
+
+
 def manhattan_distance(x1: int, y1: int, x2: int, y2: int) -> int:
     """
     Compute Manhattan distance between two coordinates
@@ -109,6 +131,8 @@ def beacon_exclusion_row(
         if in_ranges(x, ranges):
             count += 1
 
+    record_count('points_scanned', max_x - min_x + 1)
+
     return count
 
 
@@ -135,6 +159,9 @@ def find_beacon_location(
     This assumes there is exactly one such location in the given range, and will fail to
     provide the right coordinates if this assumption is incorrect.
     """
+    # number of rows scanned along sensor borders
+    rows_scanned = 0
+
     # iterate over sensors
     for sx, sy, distance in sensors:
         # iterate over rows within sensor's exclusion zone
@@ -143,27 +170,30 @@ def find_beacon_location(
             if not in_range(y, allowed_range):
                 continue
 
+            rows_scanned += 1
             # get exclusion range at row y
             lx, rx = get_exclusion_range(y, sx, sy, distance)
 
             # check if beacon can exist to the left of the exclusion zone
             if in_range(lx - 1, allowed_range) and beacon_can_exist(lx - 1, y, sensors):
+                record_count('border_rows_scanned', rows_scanned)
                 return lx - 1, y
 
             # check if beacon can exist to the right of the exclusion zone
             if in_range(rx + 1, allowed_range) and beacon_can_exist(rx + 1, y, sensors):
+                record_count('border_rows_scanned', rows_scanned)
                 return rx + 1, y
 
+    record_count('border_rows_scanned', rows_scanned)
+
     return None
 
 
-if __name__ == '__main__':
-    # file with sensors and beacons data
-    file_path = '../sensors_and_beacons.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
-
+def parse(file_path: str) -> tuple[list[tuple[int, int, int]], set[tuple[int, int]]]:
+    """
+    Parse file into sensor locations with distances to corresponding closest beacons,
+    and set of beacon locations.
+    """
     # regex pattern for parsing input
     regex_pattern = re.compile(
         r'^\D*x\s*=\s*(-?\d+)\D*y\s*=\s*(-?\d+)\D*x\s*=\s*(-?\d+)\D*y\s*=\s*(-?\d+)\D*$'
@@ -175,23 +205,33 @@ if __name__ == '__main__':
     # set of coordinates of beacons
     beacons = set()
 
-    for line in file_contents.splitlines():
+    for line in read_lines(file_path):
         # parse and store sensor and beacon locations
         result = regex_pattern.search(line)
         sx, sy, bx, by = [int(i) for i in result.groups()]
         sensors.append((sx, sy, manhattan_distance(sx, sy, bx, by)))
         beacons.add((bx, by))
 
-    # y = 10
-    # allowed_range = (0, 20)
-    y = 2000000
-    allowed_range = (0, 4000000)
-    # constant for finding tuning frequency
-    c = 4000000
+    record_count('sensors', len(sensors))
+
+    return sensors, beacons
+
+
+def part1(sensors_and_beacons: tuple[list[tuple[int, int, int]], set[tuple[int, int]]]) -> int:
+    sensors, beacons = sensors_and_beacons
+
+    return beacon_exclusion_row(EXCLUSION_ROW_Y, sensors, beacons)
 
-    beacon_exclusion_row_count = beacon_exclusion_row(y, sensors, beacons)
-    print(beacon_exclusion_row_count)
 
-    bx, by = find_beacon_location(sensors, allowed_range)
-    freq = tuning_frequency(bx, by, c)
-    print(freq)
+def part2(sensors_and_beacons: tuple[list[tuple[int, int, int]], set[tuple[int, int]]]) -> int:
+    sensors, _ = sensors_and_beacons
+    bx, by = find_beacon_location(sensors, ALLOWED_RANGE)
+
+    return tuning_frequency(bx, by, TUNING_FREQUENCY_CONSTANT)
+
+
+if __name__ == '__main__':
+    sensors_and_beacons = parse(INPUT_FILE_PATH)
+
+    print(part1(sensors_and_beacons))
+    print(part2(sensors_and_beacons))
@@ -1,8 +1,22 @@
+import os
+import sys
 import re
 import heapq
 from itertools import combinations
 
 
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import read_lines
+from aoc.instrumentation import count, timer
+
+# file with valves data
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'valves.txt')
+
+
 def valves_floyd_warshall(
     valves_data: dict[str, dict[str, int | frozenset | dict[str, int]]],
 ):
@@ -60,6 +74,9 @@ def max_pressure_released(
     ]
     # initalize maximum pressure released
     max_pressure = 0
+    # total number of items pushed to and popped from queue
+    total_push_count = 0
+    total_pop_count = 0
     # set of valves with zero flow rate
     zero_valves = frozenset([k for k, v in valves_data.items() if v['flow'] < 1])
 
@@ -72,6 +89,7 @@ def max_pressure_released(
             current_valve,
             unopened_valves,
         ) = heapq.heappop(queue)
+        total_pop_count += 1
         # number of items pushed to queue in current loop
         push_count = 0
 
@@ -108,6 +126,11 @@ def max_pressure_released(
             if pressure > max_pressure:
                 max_pressure = pressure
 
+        total_push_count += push_count
+
+    count('heap_pushes', total_push_count)
+    count('heap_pops', total_pop_count)
+
     return max_pressure
 
 
@@ -141,6 +164,9 @@ def max_pressure_released_with_elephant(
         )]
     # initalize maximum pressure released
     max_pressure = 0
+    # total number of items pushed to and popped from queue
+    total_push_count = 0
+    total_pop_count = 0
     # set of valves with zero flow rate
     zero_valves = frozenset([k for k, v in valves_data.items() if v['flow'] < 1])
     # set of visited paths
@@ -160,6 +186,7 @@ def max_pressure_released_with_elephant(
             path_me,
             path_elephant,
         ) = heapq.heappop(queue)
+        total_pop_count += 1
         # number of items pushed to queue in current loop
         push_count = 0
 
@@ -258,16 +285,19 @@ def max_pressure_released_with_elephant(
             if pressure >= max_pressure:
                 max_pressure = pressure
 
-    return max_pressure
+        total_push_count += push_count
 
+    count('heap_pushes', total_push_count)
+    count('heap_pops', total_pop_count)
+    count('visited_paths', len(visited))
 
-if __name__ == '__main__':
-    # file with valves data
-    file_path = '../valves.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
+    return max_pressure
 
+
+def parse(file_path: str) -> dict[str, dict[str, int | frozenset | dict[str, int]]]:
+    """
+    Parse file into valves data, including distances between all valve pairs.
+    """
     # regex pattern for parsing input
     regex_pattern = re.compile(
         r'^Valve\s+(\D{2})\s+has\s+flow\s+rate\s*=\s*(\d+)\s*;\s*tunnels?\s+leads?\s+to\s+valves?\s+([\D,\s]+)$'
@@ -277,7 +307,7 @@ if __name__ == '__main__':
     valves_data = {}
 
     # iterate over file lines, parse and store contents
-    for line in file_contents.splitlines():
+    for line in read_lines(file_path):
         result = regex_pattern.search(line)
 
         valves_data[result.group(1)] = {
@@ -286,7 +316,24 @@ if __name__ == '__main__':
         }
 
     # compute all valve pair distances
-    valves_floyd_warshall(valves_data)
+    with timer('floyd_warshall'):
+        valves_floyd_warshall(valves_data)
+
+    count('valves', len(valves_data))
+
+    return valves_data
+
+
+def part1(valves_data: dict[str, dict[str, int | frozenset | dict[str, int]]]) -> int:
+    return max_pressure_released('AA', valves_data, 30)
+
+
+def part2(valves_data: dict[str, dict[str, int | frozenset | dict[str, int]]]) -> int:
+    return max_pressure_released_with_elephant('AA', valves_data, 26)
+
+
+if __name__ == '__main__':
+    valves_data = parse(INPUT_FILE_PATH)
 
-    # print(max_pressure_released('AA', valves_data, 30))
-    print(max_pressure_released_with_elephant('AA', valves_data, 26))
+    print(part1(valves_data))
+    print(part2(valves_data))
@@ -1,5 +1,28 @@
-import numpy as np
-import numpy.typing as npt
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import read_chars
+from aoc.grid import pack, render
+from aoc.instrumentation import count
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# numpy is only imported once a solution first uses it
+np = lazy_import('numpy')
+
+# file with jet patterns
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'jet_patterns.txt')
 
 
 def array_first_true(A: npt.NDArray[np.bool_]) -> int:
@@ -72,7 +95,7 @@ class Tunnel:
         """
         String representation of tunnel for debugging.
         """
-        return '\n'.join([''.join(row) for row in np.where(self.grid, '#', '.')])
+        return render(self.grid, {False: '.', True: '#'})
 
     def get_jet_pattern(self) -> str:
         """
@@ -137,7 +160,8 @@ class Tunnel:
         Drop given rock into tunnel and place it where the rock stops moving.
         """
         # cache state of grid, rock used, and the jet pattern index
-        cache_item = (self.grid.tobytes(), id(rock), self.jet_idx)
+        # grid is bit-packed, with its height kept since packing drops the shape
+        cache_item = (pack(self.grid), self.grid.shape[0], id(rock), self.jet_idx)
         # return cached item if already cached
         if cache_item in self.cycle_cache:
             return self.cycle_cache[cache_item]
@@ -158,7 +182,10 @@ class Tunnel:
         # loop until collision occurs
         top_left = (0, self.left_offset)
         collision = False
+        # number of collision checks made while dropping rock
+        collision_checks = 0
         while not collision:
+            collision_checks += 2
             jet_pattern = self.get_jet_pattern()
             if jet_pattern == '<':
                 next_top_left = (top_left[0], top_left[1] - 1)
@@ -184,6 +211,8 @@ class Tunnel:
         self.place_rock(rock, top_left)
         self.truncate_grid()
 
+        count('detect_collision_calls', collision_checks)
+
         return None
 
     def get_height(self) -> int:
@@ -198,101 +227,129 @@ class CollisionException(BaseException):
     pass
 
 
-if __name__ == '__main__':
-    # file with jet patterns
-    file_path = '../jet_patterns.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
+# rocks with given structures, dropped in order
+ROCK_PATTERNS = [
+    #   Rock Structure:
+    #   ####
+    Rock(
+        dimensions=(1, 4),
+        structure=(
+            (0, 0),
+            (0, 1),
+            (0, 2),
+            (0, 3),
+        )
+    ),
+    #   Rock Structure:
+    #   .#.
+    #   ###
+    #   .#.
+    Rock(
+        dimensions=(3, 3),
+        structure=(
+            (0, 1),
+            (1, 0),
+            (1, 1),
+            (1, 2),
+            (2, 1),
+        )
+    ),
+    #   Rock Structure:
+    #   ..#
+    #   ..#
+    #   ###
+    Rock(
+        dimensions=(3, 3),
+        structure=(
+            (0, 2),
+            (1, 2),
+            (2, 0),
+            (2, 1),
+            (2, 2),
+        )
+    ),
+    #   Rock Structure:
+    #   #
+    #   #
+    #   #
+    #   #
+    Rock(
+        dimensions=(4, 1),
+        structure=(
+            (0, 0),
+            (1, 0),
+            (2, 0),
+            (3, 0),
+        )
+    ),
+    #   Rock Structure:
+    #   ##
+    #   ##
+    Rock(
+        dimensions=(2, 2),
+        structure=(
+            (0, 0),
+            (0, 1),
+            (1, 0),
+            (1, 1),
+        )
+    ),
+]
 
+
+def parse(file_path: str) -> list[str]:
+    """
+    Parse file into list of jet patterns.
+    """
     # get list of jet patterns
-    jet_patterns = list(file_contents.strip())
-    # create rocks with given structures
-    rock_patterns = [
-        #   Rock Structure:
-        #   ####
-        Rock(
-            dimensions=(1, 4),
-            structure=(
-                (0, 0),
-                (0, 1),
-                (0, 2),
-                (0, 3),
-            )
-        ),
-        #   Rock Structure:
-        #   .#.
-        #   ###
-        #   .#.
-        Rock(
-            dimensions=(3, 3),
-            structure=(
-                (0, 1),
-                (1, 0),
-                (1, 1),
-                (1, 2),
-                (2, 1),
-            )
-        ),
-        #   Rock Structure:
-        #   ..#
-        #   ..#
-        #   ###
-        Rock(
-            dimensions=(3, 3),
-            structure=(
-                (0, 2),
-                (1, 2),
-                (2, 0),
-                (2, 1),
-                (2, 2),
-            )
-        ),
-        #   Rock Structure:
-        #   #
-        #   #
-        #   #
-        #   #
-        Rock(
-            dimensions=(4, 1),
-            structure=(
-                (0, 0),
-                (1, 0),
-                (2, 0),
-                (3, 0),
-            )
-        ),
-        #   Rock Structure:
-        #   ##
-        #   ##
-        Rock(
-            dimensions=(2, 2),
-            structure=(
-                (0, 0),
-                (0, 1),
-                (1, 0),
-                (1, 1),
-            )
-        ),
-    ]
+    jet_patterns = [c for c in read_chars(file_path) if not c.isspace()]
+
+    return jet_patterns
 
+
+def tower_height(jet_patterns: list[str], n_rocks: int) -> int:
+    """
+    Get height of tower after dropping given number of rocks, extrapolating from
+    detected cycles.
+    """
     t = Tunnel(jet_patterns)
-    n_rock_patterns = len(rock_patterns)
-    # number of rocks to drop
-    n_rocks = 1000000000000
+    n_rock_patterns = len(ROCK_PATTERNS)
     # list of heights after every rock is dropped
     heights = []
+    starting_idx = None
     for i in range(n_rocks):
-        starting_idx = t.drop_rock(rock_patterns[i % n_rock_patterns])
+        starting_idx = t.drop_rock(ROCK_PATTERNS[i % n_rock_patterns])
         if starting_idx is not None:
             break
 
         heights.append(t.get_height())
 
+    count('rocks_dropped', len(heights))
+    count('cycle_cache_size', len(t.cycle_cache))
+
+    # return height directly if all rocks dropped before detecting a cycle
+    if starting_idx is None:
+        return t.get_height()
+
     cycle_length = i - starting_idx
     starting_height = heights[starting_idx - 1]
     cycle_height = heights[i - 1] - heights[starting_idx - 1]
     n_cycles = (n_rocks - starting_idx) // cycle_length
     remainder_height = heights[n_rocks - (n_cycles * cycle_length) - 1] - starting_height
 
-    print(starting_height + remainder_height + (n_cycles * cycle_height))
+    return starting_height + remainder_height + (n_cycles * cycle_height)
+
+
+def part1(jet_patterns: list[str]) -> int:
+    return tower_height(jet_patterns, 2022)
+
+
+def part2(jet_patterns: list[str]) -> int:
+    return tower_height(jet_patterns, 1000000000000)
+
+
+if __name__ == '__main__':
+    jet_patterns = parse(INPUT_FILE_PATH)
+
+    print(part1(jet_patterns))
+    print(part2(jet_patterns))
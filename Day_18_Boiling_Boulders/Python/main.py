@@ -1,199 +1,75 @@
-Coordinates = tuple[int, int, int]
+from __future__ import annotations
 
+import os
+import sys
+from typing import TYPE_CHECKING
 
-def get_adjacent_coordinates(coordinates: Coordinates) -> set[Coordinates]:
-    """
-    Given coordinates, get set of top, bottom, front, back, left and right coordinates.
-    """
-    adjacent_coordinates = set([
-        (coordinates[0] - 1, coordinates[1], coordinates[2]),
-        (coordinates[0] + 1, coordinates[1], coordinates[2]),
-        (coordinates[0], coordinates[1] - 1, coordinates[2]),
-        (coordinates[0], coordinates[1] + 1, coordinates[2]),
-        (coordinates[0], coordinates[1], coordinates[2] - 1),
-        (coordinates[0], coordinates[1], coordinates[2] + 1),
-    ])
-
-    return adjacent_coordinates
-
-
-def coordinates_in_range(
-    coordinates: Coordinates,
-    min_x: int,
-    max_x: int,
-    min_y: int,
-    max_y: int,
-    min_z: int,
-    max_z: int,
-) -> bool:
-    """
-    Check if coordinates lie in given range.
-    """
-    in_range = (
-        coordinates[0] >= min_x and
-        coordinates[0] <= max_x and
-        coordinates[1] >= min_y and
-        coordinates[1] <= max_y and
-        coordinates[2] >= min_z and
-        coordinates[2] <= max_z
-    )
-
-    return in_range
-
-
-def exterior_air_coordinates(
-    starting_coordinates: Coordinates,
-    boulders: set[Coordinates],
-    min_x: int,
-    max_x: int,
-    min_y: int,
-    max_y: int,
-    min_z: int,
-    max_z: int,
-) -> set[Coordinates]:
-    """
-    Get set of coordinates of exterior air (i.e. air not trapped in air pockets).
-    """
-    # set of exterior air coordinates
-    exterior_air = set()
-    # set of already visited coordinates
-    visited = set([starting_coordinates])
-    # coordinates queue
-    queue = [starting_coordinates]
-
-    while len(queue) > 0:
-        # get next coordinates from queue
-        coordinates = queue.pop(0)
-        exterior_air.add(coordinates)
-        # get surrounding coordinates as candidates for next traversal
-        adjacent_coordinates = get_adjacent_coordinates(coordinates)
-
-        for adjacent_coor in adjacent_coordinates:
-            # skip if visited
-            if adjacent_coor in visited:
-                continue
-
-            visited.add(adjacent_coor)
-
-            # skip if blocked by boulders
-            if adjacent_coor in boulders:
-                continue
-
-            # skip if out of range
-            if not coordinates_in_range(
-                adjacent_coor,
-                min_x,
-                max_x,
-                min_y,
-                max_y,
-                min_z,
-                max_z,
-            ):
-                continue
-
-            # add coordinates to queue
-            queue.append(adjacent_coor)
-
-    return exterior_air
-
-
-def get_boulders_range(
-    boulders: set[Coordinates],
-) -> tuple[int, int, int, int, int, int]:
-    """
-    Given boulders coordinates, get minimum and maximum coordinates in all dimensions.
-    """
-    min_x = float('inf')
-    max_x = -float('inf')
-    min_y = float('inf')
-    max_y = -float('inf')
-    min_z = float('inf')
-    max_z = -float('inf')
-
-    # iterate over boulders and update min/max values
-    for boulder in boulders:
-        min_x = min(min_x, boulder[0])
-        max_x = max(max_x, boulder[0])
-        min_y = min(min_y, boulder[1])
-        max_y = max(max_y, boulder[1])
-        min_z = min(min_z, boulder[2])
-        max_z = max(max_z, boulder[2])
-
-    return min_x, max_x, min_y, max_y, min_z, max_z
-
-
-def naive_surface_area(boulders: set[Coordinates]) -> int:
+
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import read_lines
+from aoc.grid import count_neighbours, flood_fill, from_coordinates
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# numpy is only imported once a solution first uses it
+np = lazy_import('numpy')
+
+# file with boulder locations
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'boulders.txt')
+
+
+def naive_surface_area(boulders: npt.NDArray[np.bool_]) -> int:
     """
-    Naively compute surface area by counting touching boulder sides.
+    Naively compute surface area by counting boulder sides not covered by boulders.
     """
-    surface_area = 0
-    for boulder in boulders:
-        total_sides = 6
-        # get adjacent boulder coordinates
-        adjacent_boulders = get_adjacent_coordinates(boulder).intersection(boulders)
-        # number of sides covered by boulders
-        covered_sides = len(adjacent_boulders)
-
-        # update surface area
-        surface_area += total_sides - covered_sides
+    # number of sides covered by boulders, for every boulder
+    covered_sides = count_neighbours(boulders)[boulders]
 
-    return surface_area
+    return int(6 * covered_sides.shape[0] - covered_sides.sum())
 
 
-def exterior_surface_area(boulders: set[Coordinates]) -> int:
+def exterior_surface_area(boulders: npt.NDArray[np.bool_]) -> int:
     """
     Compute exterior surface area by counting boulder sides touching exterior air.
     """
-    # get iteration range
-    min_x, max_x, min_y, max_y, min_z, max_z = get_boulders_range(boulders)
-    # get exterior air coordinates
-    exterior_air = exterior_air_coordinates(
-        (min_x, min_y, min_z),
-        boulders,
-        min_x,
-        max_x,
-        min_y,
-        max_y,
-        min_z,
-        max_z,
-    )
-
-    surface_area = 0
-    for boulder in boulders:
-        # get boulder's surrounding coordinates
-        adjacent_coordinates = get_adjacent_coordinates(boulder)
-
-        for adjacent_coor in adjacent_coordinates:
-            # check if coordinates in range
-            in_range = coordinates_in_range(
-                adjacent_coor,
-                min_x,
-                max_x,
-                min_y,
-                max_y,
-                min_z,
-                max_z,
-            )
-            # if coordinates belong to exterior air, then boulder's side is exposed
-            # additionally, if coordinates are out of range, boulder's side is exposed
-            if adjacent_coor in exterior_air or not in_range:
-                surface_area += 1
-
-    return surface_area
+    # exterior air (i.e. air not trapped in air pockets) is connected to the corner,
+    # which is always air as the grid is padded
+    exterior_air = flood_fill(~boulders, [(0,) * boulders.ndim])
 
+    return int(count_neighbours(exterior_air)[boulders].sum())
 
-if __name__ == '__main__':
-    # file with boulder locations
-    file_path = '../boulders.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
 
+def parse(file_path: str) -> npt.NDArray[np.bool_]:
+    """
+    Parse file into 3d boolean grid of boulders, padded with air on every side.
+    """
     # parse boulder coordinates from file
-    boulders = set([
+    coordinates = [
         tuple([int(dim) for dim in line.split(',')])
-        for line in file_contents.splitlines()
-    ])
+        for line in read_lines(file_path)
+        if len(line.strip()) > 0
+    ]
+    boulders, _ = from_coordinates(coordinates, padding=1)
+
+    return boulders
+
+
+def part1(boulders: npt.NDArray[np.bool_]) -> int:
+    return naive_surface_area(boulders)
+
+
+def part2(boulders: npt.NDArray[np.bool_]) -> int:
+    return exterior_surface_area(boulders)
+
+
+if __name__ == '__main__':
+    boulders = parse(INPUT_FILE_PATH)
 
-    print(naive_surface_area(boulders))
-    print(exterior_surface_area(boulders))
\ No newline at end of file
+    print(part1(boulders))
+    print(part2(boulders))
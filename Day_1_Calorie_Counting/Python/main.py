@@ -1,17 +1,311 @@
+from __future__ import annotations
+
+import os
+import sys
+import mmap
 import heapq
+from typing import TYPE_CHECKING, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 
 
-if __name__ == '__main__':
-    # file with input calories data
-    file_path = '../calories.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import line_chunks, map_bytes, read_records
+from aoc.solvers import load_solver
+from aoc.instrumentation import count
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# numpy is only imported once a solution first uses it
+np = lazy_import('numpy')
+
+# file with input calories data
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'calories.txt')
+# number of bytes parsed at a time by vectorized parser, extended to the next newline
+PARSE_CHUNK_SIZE = 1 << 22
+
+
+def read_elf_calories(file_path: str) -> Iterator[int]:
+    """
+    Lazily read total calories of each elf, one elf at a time.
+    """
+    for record in read_records(file_path):
+        yield sum([int(j) for j in record])
+
+
+def _parse_calories_chunk(chars: npt.NDArray[np.uint8]) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], int]:
+    """
+    Parse chunk of whole lines into its integers, number of newlines before every
+    integer since the previous one, or since the start of chunk for the first, and
+    number of newlines after the last integer. Arrays are one entry per integer or
+    newline, never per digit.
+    """
+    # digit values, with every other character wrapping around to 10 or more
+    digits = chars - np.uint8(ord('0'))
+    is_digit = digits < 10
+
+    # positions of first digit of every integer and of first character after it
+    edges = np.flatnonzero(is_digit[1:] != is_digit[:-1]).astype(np.int32) + 1
+    if is_digit.shape[0] > 0 and is_digit[0]:
+        edges = np.concatenate((np.zeros(1, dtype=np.int32), edges))
+    if is_digit.shape[0] > 0 and is_digit[-1]:
+        edges = np.concatenate((edges, np.array([is_digit.shape[0]], dtype=np.int32)))
+
+    starts = edges[0::2]
+    ends = edges[1::2]
+    newlines = np.flatnonzero(chars == ord('\n')).astype(np.int32)
+    if starts.shape[0] == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), newlines.shape[0]
+
+    # integers are built one digit place at a time, from their first digit
+    lengths = ends - starts
+    integers = np.zeros(starts.shape[0], dtype=np.int64)
+    for place in range(int(lengths.max())):
+        longer = np.flatnonzero(lengths > place)
+        integers[longer] = integers[longer] * 10 + digits[starts[longer] + place]
+
+    # newlines before every integer, counted from newline positions at integer boundaries
+    newlines_before_starts = np.searchsorted(newlines, starts)
+    newlines_before_ends = np.searchsorted(newlines, ends)
+    gaps = newlines_before_starts - np.concatenate(([0], newlines_before_ends[:-1]))
+
+    return integers, gaps, newlines.shape[0] - int(newlines_before_ends[-1])
+
+
+def parse_elf_calories(buffer: bytes | mmap.mmap, chunk_size: int = PARSE_CHUNK_SIZE) -> npt.NDArray[np.int64]:
+    """
+    Parse buffer of food item calories into total calories for each elf, with all
+    integers of a chunk of lines parsed at once and no per-line Python work. Carriage
+    returns and other whitespace are ignored, and elves are separated by one or more
+    blank lines. Only one chunk is parsed at a time, with the elf crossing the end of
+    a chunk carried over into the next one.
+    """
+    elf_calories = []
+    # total of last elf seen so far, which may continue in the next chunk
+    open_total = None
+    # newlines after last integer seen so far
+    trailing_newlines = 0
+
+    # chunks end right after a newline, so integers are never split across chunks
+    for start, end in line_chunks(buffer, chunk_size):
+        integers, gaps, chunk_trailing_newlines = _parse_calories_chunk(
+            np.frombuffer(buffer, dtype=np.uint8, count=end - start, offset=start)
+        )
+
+        if integers.shape[0] == 0:
+            trailing_newlines += chunk_trailing_newlines
+            continue
+
+        gaps[0] += trailing_newlines
+        trailing_newlines = chunk_trailing_newlines
+
+        # new elf starts wherever two or more newlines, i.e. a blank line, lie between
+        # consecutive integers
+        elf_starts = np.flatnonzero(gaps >= 2)
+        continues_open = open_total is not None and (elf_starts.shape[0] == 0 or elf_starts[0] != 0)
+        if elf_starts.shape[0] == 0 or elf_starts[0] != 0:
+            elf_starts = np.concatenate(([0], elf_starts))
+
+        totals = np.add.reduceat(integers, elf_starts)
+        if continues_open:
+            totals[0] += open_total
+        elif open_total is not None:
+            elf_calories.append(np.array([open_total], dtype=np.int64))
+
+        elf_calories.append(totals[:-1])
+        open_total = int(totals[-1])
+
+    if open_total is not None:
+        elf_calories.append(np.array([open_total], dtype=np.int64))
+
+    if len(elf_calories) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    return np.concatenate(elf_calories)
+
+
+def parse(file_path: str) -> list[int]:
+    """
+    Parse file into list of total calories for each elf.
+    """
+    # parse elves' food item calories one chunk at a time from memory-mapped file
+    with map_bytes(file_path) as mapped:
+        elf_calories = parse_elf_calories(mapped).tolist()
+
+    count('elves', len(elf_calories))
+
+    return elf_calories
+
+
+def top_k_elves(elf_calories: Iterable[int], k: int) -> list[tuple[int, int]]:
+    """
+    Get top k total calories, largest first, along with indices of the elves
+    carrying them. Only a size k heap is kept, so memory stays constant in the number
+    of elves. Ties are resolved in favour of earlier elves.
+    """
+    if k < 1:
+        raise ValueError(f'invalid k {k}')
+
+    # min heap of (calories, negative elf index)
+    # so the smallest total, and the latest elf among equal totals, is replaced first
+    heap = []
+    for i, calories in enumerate(elf_calories):
+        item = (calories, -i)
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    return [(calories, -neg_i) for calories, neg_i in sorted(heap, reverse=True)]
+
+
+def stream_top_k_elves(file_path: str, k: int) -> list[tuple[int, int]]:
+    """
+    Get top k total calories and elf indices straight from file, reading one elf at a
+    time instead of parsing every elf's total up front.
+    """
+    return top_k_elves(read_elf_calories(file_path), k)
 
-    # parse file contents into list of total calories for each elf
-    elf_calories = [sum([int(j) for j in i.split()]) for i in file_contents.split('\n\n')]
 
+def _previous_line_blank(mapped: mmap.mmap, pos: int) -> bool:
+    """
+    Check if line ending right before given line start position is blank.
+    """
+    line_start = mapped.rfind(b'\n', 0, pos - 1) + 1
+
+    return len(mapped[line_start : pos].strip()) == 0
+
+
+def _range_top_k_elves(file_path: str, start: int, end: int, k: int) -> tuple[list[tuple[int, int]], int]:
+    """
+    Get top k total calories among elves whose groups start in byte range [start,
+    end), with elf indices relative to the range, and number of such elves. A group
+    straddling the end of the range is read to its end, while the tail of a group
+    straddling the start is left to the previous range.
+    """
+    # number of elves starting in range
+    n_elves = 0
+
+    def range_elf_calories(mapped: mmap.mmap) -> Iterator[int]:
+        nonlocal n_elves
+
+        # first line starting at or after start of range
+        pos = 0 if start == 0 else mapped.find(b'\n', start - 1) + 1
+        if start > 0 and pos == 0:
+            return
+
+        mapped.seek(pos)
+        # skip lines of group started in previous range
+        skipping = pos > 0 and not _previous_line_blank(mapped, pos)
+        total = None
+
+        while True:
+            line_start = mapped.tell()
+            line = mapped.readline()
+            if len(line) == 0:
+                break
+
+            # blank line ends current group
+            if len(line.strip()) == 0:
+                skipping = False
+                if total is not None:
+                    n_elves += 1
+                    yield total
+                    total = None
+
+                continue
+
+            if skipping:
+                continue
+
+            if total is None:
+                # groups starting after range belong to the next range
+                if line_start >= end:
+                    break
+
+                total = 0
+
+            total += int(line)
+
+        if total is not None:
+            n_elves += 1
+            yield total
+
+    with map_bytes(file_path) as mapped:
+        if len(mapped) == 0:
+            return [], 0
+
+        top_k = top_k_elves(range_elf_calories(mapped), k)
+
+    return top_k, n_elves
+
+
+def merge_top_k_elves(partials: list[tuple[list[tuple[int, int]], int]], k: int) -> list[tuple[int, int]]:
+    """
+    Merge top k results of consecutive ranges, each with elf indices relative to its
+    range and its number of elves, into global top k.
+    """
+    candidates = []
+    # number of elves in all previous ranges
+    offset = 0
+    for top_k, n_elves in partials:
+        candidates += [(calories, offset + i) for calories, i in top_k]
+        offset += n_elves
+
+    return heapq.nlargest(k, candidates, key=lambda candidate: (candidate[0], -candidate[1]))
+
+
+def parallel_top_k_elves(file_path: str, k: int, n_workers: int | None = None) -> list[tuple[int, int]]:
+    """
+    Get top k total calories and elf indices by splitting file into one byte range
+    per worker process, computing top k of each range and merging them. Uses as many
+    workers as CPUs if n_workers is not given.
+    """
+    if k < 1:
+        raise ValueError(f'invalid k {k}')
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+
+    size = os.path.getsize(file_path)
+    bounds = [size * i // n_workers for i in range(n_workers + 1)]
+
+    # workers load this solver so tasks can refer to its functions when spawned
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=load_solver, initargs=(1,)) as executor:
+        partials = list(executor.map(
+            _range_top_k_elves,
+            [file_path] * n_workers,
+            bounds[:-1],
+            bounds[1:],
+            [k] * n_workers,
+        ))
+
+    return merge_top_k_elves(partials, k)
+
+
+def top_k_calories_sum(elf_calories: list[int], k: int) -> int:
+    """
+    Compute sum of top k calories.
+    """
+    return sum(heapq.nlargest(k, elf_calories))
+
+
+def part1(elf_calories: list[int]) -> int:
+    return top_k_calories_sum(elf_calories, 1)
+
+
+def part2(elf_calories: list[int]) -> int:
+    return top_k_calories_sum(elf_calories, 3)
+
+
+if __name__ == '__main__':
+    elf_calories = parse(INPUT_FILE_PATH)
+
+    print(part1(elf_calories))
     # compute and print sum of top 3 calories
-    k = 3
-    top_k_calories_sum = sum(heapq.nlargest(k, elf_calories))
-    print(top_k_calories_sum)
+    print(part2(elf_calories))
@@ -1,3 +1,29 @@
+from __future__ import annotations
+
+import os
+import sys
+from collections import Counter
+
+
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import map_bytes, read_lines
+from aoc.instrumentation import count
+from aoc.lazy import lazy_import
+
+# numpy is only imported once a solution first uses it
+np = lazy_import('numpy')
+
+# file with input rock paper scissors data
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'rockpaperscissors.txt')
+# number of bytes in every line of the form "A X\n"
+LINE_WIDTH = 4
+# number of lines counted at a time from mapped file
+LINES_PER_BATCH = 1 << 20
+
 # scores based on outcome
 OUTCOME_SCORES = {
     1: 0,  # loss for user
@@ -46,30 +72,111 @@ def what_to_play(opponent_plays, outcome):
     return i_play
 
 
-if __name__ == '__main__':
-    # file with input rock paper scissors data
-    file_path = '../rockpaperscissors.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
+# score of every (opponent's play, second column) pair, indexed from zero
+# part 1 reads second column as user's play, part 2 as wanted outcome
+PART1_SCORE_TABLE = [[rock_paper_scissors_score(o, i) for i in (1, 2, 3)] for o in (1, 2, 3)]
+PART2_SCORE_TABLE = [[rock_paper_scissors_score(o, what_to_play(o, i)) for i in (1, 2, 3)] for o in (1, 2, 3)]
+
+
+def total_score(strategy_counts: list[list[int]], score_table: list[list[int]]) -> int:
+    """
+    Compute total score as dot product of strategy counts and score table.
+    """
+    return sum([
+        strategy_counts[o][i] * score_table[o][i]
+        for o in range(3)
+        for i in range(3)
+    ])
+
+
+def count_strategies_bytes(buffer: bytes) -> list[list[int]] | None:
+    """
+    Count rounds for every pair straight from buffer of fixed width "A X\n" lines,
+    reading both columns as strided views without splitting lines. Lines are counted
+    in batches, so little memory is needed beyond the buffer. Returns None if the
+    buffer is not made of fixed width lines.
+    """
+    chars = np.frombuffer(buffer, dtype=np.uint8)
+    # last line may be missing its newline
+    n_lines = (chars.shape[0] + 1) // LINE_WIDTH
+    if n_lines * LINE_WIDTH not in (chars.shape[0], chars.shape[0] + 1):
+        return None
+
+    # ord(c) | 0x20 lowercases letters
+    opponent = chars[0::LINE_WIDTH]
+    spaces = chars[1::LINE_WIDTH]
+    second_column = chars[2::LINE_WIDTH]
+    newlines = chars[3::LINE_WIDTH]
+
+    counts = np.zeros(9, dtype=np.int64)
+    for start in range(0, n_lines, LINES_PER_BATCH):
+        batch = slice(start, start + LINES_PER_BATCH)
+        o = (opponent[batch] | 0x20) - ord('a')
+        i = (second_column[batch] | 0x20) - ord('x')
+
+        if (
+            (o > 2).any() or
+            (i > 2).any() or
+            (spaces[batch] != ord(' ')).any() or
+            (newlines[batch] != ord('\n')).any()
+        ):
+            return None
+
+        counts += np.bincount(o * 3 + i, minlength=9)
+
+    return counts.reshape(3, 3).tolist()
+
+
+def parse(file_path: str) -> list[list[int]]:
+    """
+    Parse file into 3x3 counts of rounds for every opponent's play and second column
+    value pair, indexed from zero.
+    """
+    # count straight from mapped file when lines have fixed width
+    with map_bytes(file_path) as mapped:
+        strategy_counts = count_strategies_bytes(mapped)
+
+    if strategy_counts is not None:
+        count('rounds', sum([sum(row) for row in strategy_counts]))
+
+        return strategy_counts
 
     ascii_a = 97
     ascii_x = 120
-    # parse contents into play values
-    strategies = [[ord(i[0].lower()) - ascii_a + 1, ord(i[1].lower()) - ascii_x + 1] for i in [i.split() for i in file_contents.split('\n')]]
+    strategy_counts = [[0] * 3 for _ in range(3)]
+
+    # count identical lines first, so each distinct line is only decoded once
+    for line, n in Counter(read_lines(file_path)).items():
+        columns = line.split()
+        if len(columns) == 0:
+            continue
+
+        strategy_counts[ord(columns[0].lower()) - ascii_a][ord(columns[1].lower()) - ascii_x] += n
+
+    count('rounds', sum([sum(row) for row in strategy_counts]))
 
-    total_score = 0
-    for strategy in strategies:
-        # compute score for round
-        total_score += rock_paper_scissors_score(*strategy)
+    return strategy_counts
 
-    print(total_score)
 
-    total_score = 0
-    for strategy in strategies:
-        # determine what to play as user
-        i_play = what_to_play(*strategy)
-        # compute score for round
-        total_score += rock_paper_scissors_score(strategy[0], i_play)
+def total_scores(file_path: str) -> tuple[int, int]:
+    """
+    Compute total scores of both parts with a single pass over file.
+    """
+    strategy_counts = parse(file_path)
+
+    return total_score(strategy_counts, PART1_SCORE_TABLE), total_score(strategy_counts, PART2_SCORE_TABLE)
+
+
+def part1(strategy_counts: list[list[int]]) -> int:
+    return total_score(strategy_counts, PART1_SCORE_TABLE)
+
+
+def part2(strategy_counts: list[list[int]]) -> int:
+    return total_score(strategy_counts, PART2_SCORE_TABLE)
+
+
+if __name__ == '__main__':
+    strategy_counts = parse(INPUT_FILE_PATH)
 
-    print(total_score)
+    print(part1(strategy_counts))
+    print(part2(strategy_counts))
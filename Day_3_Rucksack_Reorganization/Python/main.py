@@ -1,3 +1,30 @@
+from __future__ import annotations
+
+import os
+import sys
+import string
+from typing import TYPE_CHECKING, Any
+
+
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import line_chunks, map_bytes, read_lines
+from aoc.instrumentation import count
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# numpy is only imported once a solution first uses it
+np = lazy_import('numpy')
+
+# file with input rucksack contents
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'rucksacks.txt')
+
+
 # get priority of item based on ASCII value
 def get_item_priority(item):
     item_ascii = ord(item)
@@ -15,68 +42,210 @@ def get_item_priority(item):
     return item_priority
 
 
-# identify duplicate item between two given strings
-def get_duplicate_items(items1, items2):
-    # set of elements in items1
-    items1_set = set(items1)
-    # set of duplicate elements
-    duplicate_items = set()
+# bitmask of each item, with bit position given by item priority
+ITEM_BITS = {item: 1 << get_item_priority(item) for item in string.ascii_letters}
+# number of item priorities, plus unused zero priority
+N_PRIORITIES = 53
+# number of bytes of rucksack lines processed at a time by batch engine
+BATCH_CHUNK_SIZE = 1 << 20
 
-    # iterate over items2 and store any duplicate items
-    for item in items2:
-        if item in items1_set:
-            duplicate_items.add(item)
 
-    # create string of duplicate items
-    return ''.join(duplicate_items)
+def encode_items(items: str) -> int:
+    """
+    Encode items as bitmask with a bit set for every item priority present.
+    """
+    try:
+        return sum(map(ITEM_BITS.__getitem__, set(items)))
+    except KeyError as e:
+        raise ValueError(f'invalid item {e.args[0]} in {items}')
 
-if __name__ == '__main__':
-    # file with input rucksack contents
-    file_path = '../rucksacks.txt'
-    # open and read file
-    with open(file_path) as f:
-        rucksacks = f.read().split()
 
-    sum_of_priorities = 0
-    for rucksack in rucksacks:
-        # split rucksack items halfway to get compartment contents
-        half_len = len(rucksack) // 2
-        compartment1, compartment2 = rucksack[:half_len], rucksack[half_len:]
+def decode_items(mask: int) -> str:
+    """
+    Get items present in bitmask, for error messages.
+    """
+    return ''.join([item for item, bit in ITEM_BITS.items() if mask & bit])
+
 
-        # get duplicate items between two compartments
-        duplicate_items = get_duplicate_items(compartment1, compartment2)
+def single_item_priority(mask: int, description: str) -> int:
+    """
+    Get priority of the only item in bitmask. Raises ValueError if there isn't
+    exactly one item.
+    """
+    if mask == 0 or mask & (mask - 1) != 0:
+        items = decode_items(mask)
+        raise ValueError(f'{len(items)} duplicates found in {description}, expected exactly 1')
 
-        # exit early if not exactly one duplicate is found
-        if len(duplicate_items) != 1:
-            print(f'{len(duplicate_items)} duplicates found in rucksack {rucksack}, expected exactly 1')
-            exit()
+    return mask.bit_length() - 1
 
-        # update sum of item priorities
-        sum_of_priorities += get_item_priority(duplicate_items)
 
-    print(sum_of_priorities)
+def parse(file_path: str) -> list[tuple[int, int]]:
+    """
+    Parse file into list of bitmasks of items in both compartments of each rucksack.
+    """
+    rucksacks = []
+    for line in read_lines(file_path):
+        rucksack = line.strip()
+        if len(rucksack) == 0:
+            continue
 
+        # split rucksack items halfway to get compartment contents
+        half_len = len(rucksack) // 2
+        rucksacks.append((encode_items(rucksack[:half_len]), encode_items(rucksack[half_len:])))
+
+    count('rucksacks', len(rucksacks))
+
+    return rucksacks
+
+
+def rucksack_occupancy(chars: npt.NDArray[np.uint8]) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.int32]]:
+    """
+    Find items present in both compartments of every non-blank line in chunk of whole
+    lines. Returns (N, 2, 53) occupancy of every priority in each compartment, which
+    rucksacks have invalid items, and 0-based line index of each rucksack within the
+    chunk. Index math is done in int32 over chunk offsets, one entry per byte.
+    """
+    # start and end of every line, without line endings
+    newlines = np.flatnonzero(chars == ord('\n')).astype(np.int32)
+    starts = np.concatenate((np.zeros(1, dtype=np.int32), newlines + 1))
+    ends = np.concatenate((newlines, np.array([chars.shape[0]], dtype=np.int32)))
+    # drop carriage returns of \r\n line endings
+    if chars.shape[0] > 0:
+        ends -= ((ends > starts) & (chars[np.maximum(ends - 1, 0)] == ord('\r'))).astype(np.int32)
+
+    # blank lines, including empty one after final newline of chunk, hold no rucksack
+    lengths = ends - starts
+    line_indices = np.flatnonzero(lengths > 0).astype(np.int32)
+    # rucksack of every line, -1 for blank lines
+    rucksacks = np.full(starts.shape[0], -1, dtype=np.int32)
+    rucksacks[line_indices] = np.arange(line_indices.shape[0], dtype=np.int32)
+
+    # line, and position within line, of every byte
+    byte_lines = np.repeat(np.arange(starts.shape[0], dtype=np.int32), np.diff(np.append(starts, chars.shape[0] + 1)))
+    byte_lines = byte_lines[: chars.shape[0]]
+    positions = np.arange(chars.shape[0], dtype=np.int32) - starts[byte_lines]
+    is_item = positions < lengths[byte_lines]
+
+    # priority of every byte value, 255 for anything but items
+    table = np.full(256, 255, dtype=np.uint8)
+    for item in string.ascii_letters:
+        table[ord(item)] = get_item_priority(item)
+
+    priorities = table[chars]
+    item_rucksacks = rucksacks[byte_lines[is_item]]
+    valid = priorities[is_item] < N_PRIORITIES
+
+    invalid_rows = np.zeros(line_indices.shape[0], dtype=np.bool_)
+    invalid_rows[item_rucksacks[~valid]] = True
+
+    # flat index of every valid item into occupancy of its rucksack and compartment
+    compartments = (positions[is_item] >= lengths[byte_lines[is_item]] // 2).astype(np.int32)
+    occupancy = np.zeros(line_indices.shape[0] * 2 * N_PRIORITIES, dtype=np.bool_)
+    occupancy[
+        (item_rucksacks[valid] * 2 + compartments[valid]) * N_PRIORITIES + priorities[is_item][valid]
+    ] = True
+
+    return occupancy.reshape(-1, 2, N_PRIORITIES), invalid_rows, line_indices
+
+
+def batch_priority_sums(file_path: str, chunk_size: int = BATCH_CHUNK_SIZE) -> dict[str, Any]:
+    """
+    Compute sums of priorities of both parts for all rucksacks, one chunk of lines at
+    a time. Rows that can't be solved are left out of the sums and listed in an error
+    report, with their line numbers, instead of aborting the run. Rucksacks of groups
+    crossing the end of a chunk are carried over into the next one.
+    """
+    n = 3
+    part1 = 0
+    part2 = 0
+    errors = []
+    # number of lines before current chunk
+    n_lines = 0
+    # items, invalid flags and line numbers of rucksacks of last incomplete group
+    carried_items = np.zeros((0, N_PRIORITIES), dtype=np.bool_)
+    carried_invalid = np.zeros(0, dtype=np.bool_)
+    carried_line_numbers = np.zeros(0, dtype=np.int64)
+
+    with map_bytes(file_path) as mapped:
+        for start, end in line_chunks(mapped, chunk_size):
+            # chunk is copied out of mapping, which can't be closed while arrays still view it
+            chars = np.frombuffer(mapped[start:end], dtype=np.uint8)
+            occupancy, invalid_rows, line_indices = rucksack_occupancy(chars)
+            line_numbers = line_indices.astype(np.int64) + n_lines + 1
+            # lines of chunk, not counting the empty one after its final newline
+            n_lines += int(np.count_nonzero(chars == ord('\n'))) + (0 if chars[-1] == ord('\n') else 1)
+
+            for k in np.flatnonzero(invalid_rows):
+                errors.append({'line': int(line_numbers[k]), 'error': 'invalid items'})
+
+            # items found in both compartments
+            duplicates = occupancy[:, 0] & occupancy[:, 1]
+            n_duplicates = duplicates.sum(axis=1)
+            part1_valid = (n_duplicates == 1) & ~invalid_rows
+            for k in np.flatnonzero((n_duplicates != 1) & ~invalid_rows):
+                errors.append({'line': int(line_numbers[k]), 'error': f'{n_duplicates[k]} duplicates found, expected exactly 1'})
+
+            part1 += int(duplicates[part1_valid].argmax(axis=1).sum())
+
+            # items found in all rucksacks of a group, including those carried over
+            items = np.concatenate((carried_items, occupancy[:, 0] | occupancy[:, 1]))
+            invalid = np.concatenate((carried_invalid, invalid_rows))
+            group_line_numbers = np.concatenate((carried_line_numbers, line_numbers))
+            n_grouped = items.shape[0] // n * n
+
+            badges = items[:n_grouped].reshape(-1, n, N_PRIORITIES).all(axis=1)
+            n_badges = badges.sum(axis=1)
+            group_invalid = invalid[:n_grouped].reshape(-1, n).any(axis=1)
+            part2_valid = (n_badges == 1) & ~group_invalid
+            for g in np.flatnonzero((n_badges != 1) & ~group_invalid):
+                errors.append({
+                    'line': int(group_line_numbers[g * n]),
+                    'error': f'{n_badges[g]} badges found in group of lines {", ".join([str(line) for line in group_line_numbers[g * n : (g + 1) * n]])}, expected exactly 1',
+                })
+
+            part2 += int(badges[part2_valid].argmax(axis=1).sum())
+
+            # incomplete last group is carried over, and left out if no rucksacks follow
+            carried_items = items[n_grouped:]
+            carried_invalid = invalid[n_grouped:]
+            carried_line_numbers = group_line_numbers[n_grouped:]
+
+    errors.sort(key=lambda error: error['line'])
+
+    return {
+        'part1': part1,
+        'part2': part2,
+        'errors': errors,
+    }
+
+
+def part1(rucksacks: list[tuple[int, int]]) -> int:
+    sum_of_priorities = 0
+    for k, (compartment1, compartment2) in enumerate(rucksacks):
+        # duplicate items between two compartments
+        duplicate_items = compartment1 & compartment2
+        sum_of_priorities += single_item_priority(duplicate_items, f'rucksack {k}')
+
+    return sum_of_priorities
+
+
+def part2(rucksacks: list[tuple[int, int]]) -> int:
     sum_of_priorities = 0
     n = 3
     # iterate over n rucksacks at a time
-    for i in range(0, len(rucksacks), n):
-        # get n rucksacks
-        n_rucksacks = rucksacks[i : i + n]
-        # break if less than n rucksacks remaining
-        if len(n_rucksacks) != 3:
-            break
-
-        duplicate_items = n_rucksacks[0]
-        # iterate over rucksack items and gather duplicate items
-        for j in range(1, n):
-            duplicate_items = get_duplicate_items(duplicate_items, n_rucksacks[j])
-
-        # exit early if not exactly one duplicate is found
-        if len(duplicate_items) != 1:
-            print(f'{len(duplicate_items)} duplicates found in rucksacks {n_rucksacks}, expected exactly 1')
-            exit()
-
-        # update sum of item priorities
-        sum_of_priorities += get_item_priority(duplicate_items)
-
-    print(sum_of_priorities)
+    for i in range(0, len(rucksacks) - n + 1, n):
+        # duplicate items among all n rucksacks
+        duplicate_items = -1
+        for compartment1, compartment2 in rucksacks[i : i + n]:
+            duplicate_items &= compartment1 | compartment2
+
+        sum_of_priorities += single_item_priority(duplicate_items, f'rucksacks {i} to {i + n - 1}')
+
+    return sum_of_priorities
+
+
+if __name__ == '__main__':
+    rucksacks = parse(INPUT_FILE_PATH)
+
+    print(part1(rucksacks))
+    print(part2(rucksacks))
@@ -1,56 +1,358 @@
-import re
+from __future__ import annotations
 
+import os
+import sys
+import mmap
+from typing import TYPE_CHECKING, Iterable
 
-# parse camp assignmets from input file line
-def parse_assignments_line(line):
-    # use regex group captures to get camp assignments
-    result = re.search(r'^(\d+)-(\d+),(\d+)-(\d+)$', line)
-    assignments = [
-        [
-            int(result.group(1)),
-            int(result.group(2)),
-        ],
-        [
-            int(result.group(3)),
-            int(result.group(4)),
-        ],
-    ]
 
-    return assignments
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import map_bytes
+from aoc.instrumentation import count
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# numpy is only imported once a solution first uses it
+np = lazy_import('numpy')
+
+# file with camp assignments input
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'camp_assignments.txt')
+# translation of assignment separators to whitespace
+ASSIGNMENT_SEPARATORS = bytes.maketrans(b'-,', b'  ')
 
 
 # check if range a contains range b
+# ranges are (start, end) pairs of ints or of arrays, checked elementwise
 def range_a_contains_b(a, b):
-    return a[0] <= b[0] and a[1] >= b[1]
+    return (a[0] <= b[0]) & (a[1] >= b[1])
 
 
 # check if range a overlaps with range b with a on the left and b on the right
 def range_a_left_overlaps_b(a, b):
-    return a[0] <= b[1] and a[1] >= b[0]
+    return (a[0] <= b[1]) & (a[1] >= b[0])
 
 
-if __name__ == '__main__':
-    # file with camp assignments input
-    file_path = '../camp_assignments.txt'
-    # open and read file
-    with open(file_path) as f:
-        lines = f.read().split()
+# class representing index over section assignments for answering ad-hoc queries
+class AssignmentIndex:
+    # kinds of queries answered by batch_query
+    QUERIES = ['stabbing', 'pairs_covering', 'overlapping', 'containing', 'contained']
+
+    def __init__(self, camp_assignments: npt.NDArray[np.int64]):
+        # number of assignment pairs
+        self.n_pairs = camp_assignments.shape[0]
+        # start and end of every assignment, first assignments of all pairs followed
+        # by second assignments, so assignment k belongs to pair k % n_pairs
+        self.starts = np.concatenate((camp_assignments[:, 0], camp_assignments[:, 2]))
+        self.ends = np.concatenate((camp_assignments[:, 1], camp_assignments[:, 3]))
+
+        # assignments ordered by start, with sorted starts and ends for counting
+        self.order_by_start = np.argsort(self.starts, kind='stable')
+        self.sorted_starts = self.starts[self.order_by_start]
+        self.sorted_ends = np.sort(self.ends)
+
+        # sorted ends of sections shared by overlapping pairs
+        shared_starts = np.maximum(camp_assignments[:, 0], camp_assignments[:, 2])
+        shared_ends = np.minimum(camp_assignments[:, 1], camp_assignments[:, 3])
+        overlapping = shared_starts <= shared_ends
+        self.sorted_shared_starts = np.sort(shared_starts[overlapping])
+        self.sorted_shared_ends = np.sort(shared_ends[overlapping])
+
+        self.build_end_rank_levels()
+        self.build_max_end_levels()
+
+    def build_max_end_levels(self):
+        """
+        Build segment tree of maximum ends over assignments in order of starts, as a
+        list of levels from the root down to the leaves, with the leaf level padded to
+        a power of two with ends below every section.
+        """
+        n_leaves = 1 << max(int(self.starts.shape[0] - 1).bit_length(), 0)
+        leaves = np.full(n_leaves, np.iinfo(np.int64).min, dtype=np.int64)
+        leaves[: self.starts.shape[0]] = self.ends[self.order_by_start]
+
+        self.max_end_levels = [leaves]
+        while self.max_end_levels[0].shape[0] > 1:
+            self.max_end_levels.insert(0, self.max_end_levels[0].reshape(-1, 2).max(axis=1))
+
+    def build_end_rank_levels(self):
+        """
+        Build wavelet matrix over ranks of assignment ends, taken in order of starts,
+        for counting ends below a rank among assignments with the smallest starts.
+        Every bit of the ranks, from the highest, gets a level storing prefix counts of
+        zero bits, after which ranks are stably reordered by that bit. This takes
+        one int32 array per bit, i.e. O(N log N) memory at worst.
+        """
+        self.distinct_ends = np.unique(self.ends)
+        ranks = np.searchsorted(self.distinct_ends, self.ends[self.order_by_start])
+
+        self.n_rank_bits = max(int(self.distinct_ends.shape[0] - 1).bit_length(), 1)
+        # prefix counts of zero bits and total number of zero bits of every level
+        self.rank_zero_counts = []
+        self.rank_n_zeros = []
+
+        for bit in range(self.n_rank_bits - 1, -1, -1):
+            is_zero = ((ranks >> bit) & 1) == 0
+            zero_counts = np.zeros(ranks.shape[0] + 1, dtype=np.int32)
+            np.cumsum(is_zero, out=zero_counts[1:])
+
+            self.rank_zero_counts.append(zero_counts)
+            self.rank_n_zeros.append(int(zero_counts[-1]))
+            ranks = np.concatenate((ranks[is_zero], ranks[~is_zero]))
+
+    def count_ranks_below(self, n: npt.NDArray[np.int64], rank: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        """
+        Count assignments with end ranks below given rank among first n assignments
+        in order of starts, one level of the wavelet matrix at a time.
+        """
+        n, rank = np.broadcast_arrays(np.asarray(n, dtype=np.int64), np.asarray(rank, dtype=np.int64))
+        # ranks beyond the highest one are above every end rank
+        above_all = rank >= (1 << self.n_rank_bits)
+        below = np.zeros(n.shape, dtype=np.int64)
+        # range of positions in current level holding the first n assignments
+        lo = np.zeros(n.shape, dtype=np.int64)
+        hi = n.copy()
+
+        for level, bit in enumerate(range(self.n_rank_bits - 1, -1, -1)):
+            zero_counts = self.rank_zero_counts[level]
+            lo_zeros = zero_counts[lo]
+            hi_zeros = zero_counts[hi]
+
+            # ranks with a zero where given rank has a one are below it, and the range
+            # follows assignments sharing given rank's bit into the next level
+            is_one = ((rank >> bit) & 1) == 1
+            below += np.where(is_one, hi_zeros - lo_zeros, 0)
+            lo = np.where(is_one, self.rank_n_zeros[level] + lo - lo_zeros, lo_zeros)
+            hi = np.where(is_one, self.rank_n_zeros[level] + hi - hi_zeros, hi_zeros)
+
+        return np.where(above_all, n, below)
+
+    @staticmethod
+    def check_ranges(a: int | npt.NDArray[np.int64], b: int | npt.NDArray[np.int64]):
+        """
+        Check that section ranges [a, b] don't end before they start.
+        """
+        a, b = np.broadcast_arrays(np.atleast_1d(a), np.atleast_1d(b))
+        reversed_ranges = np.flatnonzero(a > b)
+        if reversed_ranges.shape[0] > 0:
+            k = reversed_ranges[0]
+            raise ValueError(f'Invalid section range [{a[k]}, {b[k]}], start is after end')
+
+    def count_stabbing(self, s: int | npt.NDArray[np.int64]) -> int | npt.NDArray[np.int64]:
+        """
+        Count assignments covering section s.
+        """
+        return (
+            np.searchsorted(self.sorted_starts, s, side='right') -
+            np.searchsorted(self.sorted_ends, s, side='left')
+        )
+
+    def count_pairs_covering(self, s: int | npt.NDArray[np.int64]) -> int | npt.NDArray[np.int64]:
+        """
+        Count assignment pairs with at least one assignment covering section s. Pairs
+        where both assignments cover s are the ones whose shared sections cover s.
+        """
+        both = (
+            np.searchsorted(self.sorted_shared_starts, s, side='right') -
+            np.searchsorted(self.sorted_shared_ends, s, side='left')
+        )
+
+        return self.count_stabbing(s) - both
+
+    def count_overlapping(self, a: int | npt.NDArray[np.int64], b: int | npt.NDArray[np.int64]) -> int | npt.NDArray[np.int64]:
+        """
+        Count assignments overlapping section range [a, b], i.e. all but those ending
+        before a or starting after b.
+        """
+        self.check_ranges(a, b)
+        return (
+            self.starts.shape[0] -
+            np.searchsorted(self.sorted_ends, a, side='left') -
+            (self.starts.shape[0] - np.searchsorted(self.sorted_starts, b, side='right'))
+        )
+
+    def overlapping(self, a: int, b: int) -> npt.NDArray[np.int64]:
+        """
+        Get indices of assignments overlapping section range [a, b], i.e. ending at or
+        after a among those starting at or before b. The segment tree of maximum ends
+        is descended only into subtrees holding such assignments, so this takes
+        O(log N) per assignment found.
+        """
+        self.check_ranges(a, b)
+        n = np.searchsorted(self.sorted_starts, b, side='right')
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        # subtrees of current level that may hold overlapping assignments
+        nodes = np.zeros(1, dtype=np.int64)
+        n_leaves = self.max_end_levels[-1].shape[0]
+
+        for depth, max_ends in enumerate(self.max_end_levels):
+            # subtrees starting past the first n assignments or ending before a are dropped
+            subtree_size = n_leaves >> depth
+            nodes = nodes[(nodes * subtree_size < n) & (max_ends[nodes] >= a)]
+
+            if depth < len(self.max_end_levels) - 1:
+                nodes = np.stack((2 * nodes, 2 * nodes + 1), axis=1).reshape(-1)
+
+        return np.sort(self.order_by_start[nodes])
+
+    def count_containing(self, a: int | npt.NDArray[np.int64], b: int | npt.NDArray[np.int64]) -> int | npt.NDArray[np.int64]:
+        """
+        Count assignments containing section range [a, b], i.e. with ends at or after
+        b among assignments starting at or before a.
+        """
+        self.check_ranges(a, b)
+        n = np.searchsorted(self.sorted_starts, a, side='right')
+
+        return n - self.count_ranks_below(n, np.searchsorted(self.distinct_ends, b, side='left'))
 
-    # parse lines into camp assignments
-    camp_assignments = [parse_assignments_line(line) for line in lines]
+    def count_contained(self, a: int | npt.NDArray[np.int64], b: int | npt.NDArray[np.int64]) -> int | npt.NDArray[np.int64]:
+        """
+        Count assignments contained by section range [a, b], i.e. with ends at or
+        before b among all assignments, less those starting before a.
+        """
+        self.check_ranges(a, b)
+        n = np.searchsorted(self.sorted_starts, a, side='left')
+        rank = np.searchsorted(self.distinct_ends, b, side='right')
+
+        return self.count_ranks_below(self.starts.shape[0], rank) - self.count_ranks_below(n, rank)
+
+    def batch_query(self, queries: Iterable[tuple[str, int, int | None]]) -> list[int]:
+        """
+        Answer (kind, a, b) count queries, with b ignored by stabbing and
+        pairs_covering queries. Queries of the same kind are answered together.
+        Raises ValueError for unknown kinds and for ranges ending before they start.
+        """
+        queries = list(queries)
+        answers = [0] * len(queries)
+
+        for query in queries:
+            if query[0] not in self.QUERIES:
+                raise ValueError(f'Invalid query {query[0]}')
+
+        for kind in self.QUERIES:
+            positions = [k for k, query in enumerate(queries) if query[0] == kind]
+            if len(positions) == 0:
+                continue
+
+            a = np.array([queries[k][1] for k in positions], dtype=np.int64)
+            if kind == 'stabbing':
+                kind_answers = self.count_stabbing(a)
+            elif kind == 'pairs_covering':
+                kind_answers = self.count_pairs_covering(a)
+            else:
+                b = np.array([queries[k][2] for k in positions], dtype=np.int64)
+                kind_answers = getattr(self, f'count_{kind}')(a, b)
+
+            for k, answer in zip(positions, kind_answers.tolist()):
+                answers[k] = answer
+
+        return answers
+
+
+def assignments_well_formed(chars: npt.NDArray[np.uint8], char_counts: npt.NDArray[np.int64]) -> bool:
+    """
+    Check buffer only holds lines of the form a-b,c-d, allowing whitespace around
+    integers and separators. Every line must have four integers interleaved with a
+    dash, a comma and a dash, in that order, and no other characters.
+    """
+    # only digits, separators and whitespace are allowed
+    allowed = np.zeros(256, dtype=np.bool_)
+    allowed[[ord(c) for c in '0123456789,- \t\r\n']] = True
+    if char_counts[~allowed].sum() > 0:
+        return False
+
+    # positions of first digit of every integer and of every separator
+    is_digit = (chars >= ord('0')) & (chars <= ord('9'))
+    integer_starts = np.flatnonzero(is_digit[1:] & ~is_digit[:-1]) + 1
+    if is_digit.shape[0] > 0 and is_digit[0]:
+        integer_starts = np.concatenate(([0], integer_starts))
+
+    separators = np.flatnonzero((chars == ord(',')) | (chars == ord('-')))
+    n_pairs = integer_starts.shape[0] // 4
+    if integer_starts.shape[0] != 4 * n_pairs or separators.shape[0] != 3 * n_pairs:
+        return False
+
+    separators = separators.reshape(-1, 3)
+    if not (chars[separators] == np.array([ord('-'), ord(','), ord('-')], dtype=np.uint8)).all():
+        return False
+
+    # integers and separators alternate, starting and ending with an integer
+    integer_starts = integer_starts.reshape(-1, 4)
+    tokens = np.empty((n_pairs, 7), dtype=np.int64)
+    tokens[:, 0::2] = integer_starts
+    tokens[:, 1::2] = separators
+    if not (np.diff(tokens.reshape(-1)) > 0).all():
+        return False
+
+    # every pair lies on a single line of its own
+    newlines = np.flatnonzero(chars == ord('\n'))
+    first_lines = np.searchsorted(newlines, integer_starts[:, 0])
+    last_lines = np.searchsorted(newlines, integer_starts[:, 3])
+
+    return bool((first_lines == last_lines).all() and (first_lines[1:] > last_lines[:-1]).all())
+
+
+def parse_assignments(buffer: bytes | mmap.mmap) -> npt.NDArray[np.int64]:
+    """
+    Parse buffer of "a-b,c-d" lines into (N, 4) array of all assignment pairs at
+    once. Buffer can be memory-mapped, in which case the only full copy made is the
+    one with separators translated.
+    """
+    chars = np.frombuffer(buffer, dtype=np.uint8)
+    char_counts = np.bincount(chars, minlength=256)
+    if char_counts[ord('0') : ord('9') + 1].sum() == 0:
+        return np.zeros((0, 4), dtype=np.int64)
+
+    if not assignments_well_formed(chars, char_counts):
+        raise ValueError('invalid camp assignments, expected lines of the form a-b,c-d')
+
+    # separators become whitespace, so every integer is parsed in a single call
+    text = np.frombuffer(ASSIGNMENT_SEPARATORS, dtype=np.uint8)[chars]
+    text.flags.writeable = False
+    assignments = np.fromstring(text, dtype=np.int64, sep=' ')
+
+    return assignments.reshape(-1, 4)
+
+
+def parse(file_path: str) -> npt.NDArray[np.int64]:
+    """
+    Parse file into (N, 4) array of camp assignment pairs, with start and end of
+    first assignment followed by start and end of second assignment.
+    """
+    # parse all assignment pairs at once from memory-mapped file
+    with map_bytes(file_path) as mapped:
+        camp_assignments = parse_assignments(mapped)
+
+    count('assignment_pairs', camp_assignments.shape[0])
+
+    return camp_assignments
+
+
+def part1(camp_assignments: npt.NDArray[np.int64]) -> int:
+    a = (camp_assignments[:, 0], camp_assignments[:, 1])
+    b = (camp_assignments[:, 2], camp_assignments[:, 3])
 
     # count assignment pairs where one assignment contains another
-    contains_count = 0
-    for assignments_pair in camp_assignments:
-        if range_a_contains_b(*assignments_pair) or range_a_contains_b(*reversed(assignments_pair)):
-            contains_count += 1
+    return int((range_a_contains_b(a, b) | range_a_contains_b(b, a)).sum())
+
 
-    print(contains_count)
+def part2(camp_assignments: npt.NDArray[np.int64]) -> int:
+    a = (camp_assignments[:, 0], camp_assignments[:, 1])
+    b = (camp_assignments[:, 2], camp_assignments[:, 3])
 
     # count assignment pairs where one assignment overlaps with another
-    overlaps_count = 0
-    for assignments_pair in camp_assignments:
-        if range_a_left_overlaps_b(*assignments_pair) or range_a_left_overlaps_b(*reversed(assignments_pair)):
-            overlaps_count += 1
+    return int((range_a_left_overlaps_b(a, b) | range_a_left_overlaps_b(b, a)).sum())
+
+
+if __name__ == '__main__':
+    camp_assignments = parse(INPUT_FILE_PATH)
 
-    print(overlaps_count)
+    print(part1(camp_assignments))
+    print(part2(camp_assignments))
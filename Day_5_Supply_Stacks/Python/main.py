@@ -1,25 +1,55 @@
-import re
-import copy
+import os
+import sys
+import random
+from typing import Iterable
 
 
-# parse line in "move x from y to z" format
-def parse_move(move):
-    # perform regex search
-    result = re.search(r'^\s*move\s*(\d+)\s*from\s*(\d*)\s*to\s*(\d*)\s*$', move)
-    # capture groups
-    # from_idx and to_idx are decremented by 1 from captured groups as indexing begins at 0
-    n_crates, from_idx, to_idx = (
-        int(result.group(1)),
-        int(result.group(2)) - 1,
-        int(result.group(3)) - 1,
-    )
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
 
-    return n_crates, from_idx, to_idx
+from aoc.readers import read_records
+from aoc.instrumentation import count
+
+# file with input crates stacks data
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'crates.txt')
+
+
+# total number of crates from which stacks are kept as treaps instead of lists
+TREAP_MIN_CRATES = 1 << 14
+
+
+def parse_moves(moves: list[str]) -> list[tuple[int, int, int]]:
+    """
+    Parse all move lines at once into (number of crates, source index, destination
+    index) tuples, with stacks indexed from zero. Every line in "move x from y to z"
+    format splits into exactly six words.
+    """
+    words = '\n'.join(moves).split()
+    if (
+        len(words) != 6 * len(moves) or
+        set(words[0::6]) - {'move'} or
+        set(words[2::6]) - {'from'} or
+        set(words[4::6]) - {'to'}
+    ):
+        raise ValueError('Invalid moves, expected lines in "move x from y to z" format')
+
+    # from_idx and to_idx are decremented by 1 from parsed values as indexing begins at 0
+    return [
+        (n_crates, from_idx - 1, to_idx - 1)
+        for n_crates, from_idx, to_idx in zip(map(int, words[1::6]), map(int, words[3::6]), map(int, words[5::6]))
+    ]
 
 
 # transfer multiple crates from one stack to another
 # retain_order indicates whether or not to move crates in original or reverse order
 def transfer_crates(stack_src, stack_dest, n_crates, retain_order=False):
+    # nothing to move, and stack_src[-0:] would be the whole stack
+    # crates moved onto their own stack are put back where they were
+    if n_crates <= 0 or stack_src is stack_dest:
+        return
+
     # get ordering function
     # if retain_order = True, this is a function that returns it's input unchanged
     # if retain_order = False, this is a function that returns a reversed copy of input list
@@ -30,18 +60,159 @@ def transfer_crates(stack_src, stack_dest, n_crates, retain_order=False):
     del stack_src[-n_crates:]
 
 
-if __name__ == '__main__':
-    # file with input crates stacks data
-    file_path = '../crates.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
+# class representing crate stacks as implicit treaps sharing one pool of nodes
+# node 0 is the empty treap, so every stack is just the index of its root node
+class CrateTreaps:
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+        # per node crate, heap priority, children, subtree size and pending reversal
+        self.crates = [None]
+        self.priorities = [0.0]
+        self.left = [0]
+        self.right = [0]
+        self.sizes = [0]
+        self.reversed = [False]
+
+    def build(self, crates: Iterable[str]) -> int:
+        """
+        Build treap holding crates from bottom to top and get its root, in linear
+        time by keeping the right spine of the treap built so far.
+        """
+        spine = []
+        for crate in crates:
+            node = len(self.crates)
+            self.crates.append(crate)
+            self.priorities.append(self.rng.random())
+            self.left.append(0)
+            self.right.append(0)
+            self.sizes.append(1)
+            self.reversed.append(False)
+
+            # nodes of lower priority on the spine become the left subtree of new node
+            last = 0
+            while len(spine) > 0 and self.priorities[spine[-1]] < self.priorities[node]:
+                last = spine.pop()
+                self.update(last)
+
+            self.left[node] = last
+            if len(spine) > 0:
+                self.right[spine[-1]] = node
+
+            spine.append(node)
+
+        while len(spine) > 1:
+            self.update(spine.pop())
+
+        if len(spine) == 0:
+            return 0
+
+        self.update(spine[0])
+
+        return spine[0]
+
+    def update(self, node: int):
+        self.sizes[node] = 1 + self.sizes[self.left[node]] + self.sizes[self.right[node]]
+
+    def push(self, node: int):
+        """
+        Apply pending reversal of node by swapping its children and passing the
+        reversal on to them.
+        """
+        if self.reversed[node]:
+            left, right = self.right[node], self.left[node]
+            self.left[node], self.right[node] = left, right
+            self.reversed[left] = not self.reversed[left]
+            self.reversed[right] = not self.reversed[right]
+            self.reversed[node] = False
+            # the empty treap never holds a pending reversal
+            self.reversed[0] = False
+
+    def split(self, node: int, k: int) -> tuple[int, int]:
+        """
+        Split treap into treaps of its bottom k crates and of the rest.
+        """
+        if node == 0:
+            return 0, 0
+
+        self.push(node)
+        if self.sizes[self.left[node]] >= k:
+            bottom, self.left[node] = self.split(self.left[node], k)
+            self.update(node)
+
+            return bottom, node
+
+        self.right[node], top = self.split(self.right[node], k - self.sizes[self.left[node]] - 1)
+        self.update(node)
+
+        return node, top
+
+    def merge(self, bottom: int, top: int) -> int:
+        """
+        Merge treaps, placing crates of top above crates of bottom.
+        """
+        if bottom == 0 or top == 0:
+            return bottom or top
+
+        if self.priorities[bottom] > self.priorities[top]:
+            self.push(bottom)
+            self.right[bottom] = self.merge(self.right[bottom], top)
+            self.update(bottom)
+
+            return bottom
+
+        self.push(top)
+        self.left[top] = self.merge(bottom, self.left[top])
+        self.update(top)
+
+        return top
+
+    def reverse(self, node: int):
+        """
+        Reverse order of crates in treap, lazily in constant time.
+        """
+        if node != 0:
+            self.reversed[node] = not self.reversed[node]
 
+    def top(self, node: int) -> str:
+        """
+        Get top crate of treap.
+        """
+        if node == 0:
+            raise IndexError('empty stack has no top crate')
+
+        while True:
+            self.push(node)
+            if self.right[node] == 0:
+                return self.crates[node]
+
+            node = self.right[node]
+
+    def transfer(self, roots: list[int], from_idx: int, to_idx: int, n_crates: int, retain_order: bool = False):
+        """
+        Transfer top crates between stacks given by their roots, in expected
+        logarithmic time regardless of the number of crates.
+        """
+        # crates moved onto their own stack are put back where they were
+        if from_idx == to_idx:
+            return
+
+        rest, top = self.split(roots[from_idx], max(self.sizes[roots[from_idx]] - n_crates, 0))
+        if not retain_order:
+            self.reverse(top)
+
+        roots[from_idx] = rest
+        roots[to_idx] = self.merge(roots[to_idx], top)
+
+
+def parse(file_path: str) -> tuple[list[list[str]], list[tuple[int, int, int]]]:
+    """
+    Parse file into initial crate stacks and list of parsed moves.
+    """
     # get initial stacks and moves inputs
-    stacks_input, moves_input = file_contents.split('\n\n')
+    stacks_input, moves_input = read_records(file_path)
 
     # reverse stack lines so we can parse from bottom up
-    stacks_input = list(reversed(stacks_input.split('\n')))
+    stacks_input = list(reversed(stacks_input))
     # count number of total stacks
     n_stacks = len(stacks_input[0].split())
 
@@ -60,30 +231,86 @@ if __name__ == '__main__':
             if len(level[k].strip()) > 0:
                 stacks[j].append(level[k])
 
-    # create copy of stacks
-    stacks_copy = copy.deepcopy(stacks)
+    return stacks, parse_moves(moves_input)
 
-    # iterate over moves
-    for move in moves_input.split('\n'):
-        # parse current move
-        n_crates, from_idx, to_idx = parse_move(move)
-        # transfer appropriate crates
-        # set retain_order = False so multiple moved stacks are moved in reverse order
-        transfer_crates(stacks[from_idx], stacks[to_idx], n_crates, retain_order=False)
 
-    # join top elements of stacks
-    print(''.join([i[-1] for i in stacks]))
+def rearrange_crates(
+    stacks: list[list[str]],
+    moves: list[tuple[int, int, int]],
+    retain_orders: Iterable[bool] = (False, True),
+) -> list[str]:
+    """
+    Perform moves on separate stacks for every retain_order mode, advancing all of
+    them together in a single pass over moves, and get top crates of each stack for
+    every mode. Given stacks are left unchanged.
+    """
+    retain_orders = list(retain_orders)
+
+    # stacks are kept as treaps once they are too big for copying moved crates around
+    if sum(len(stack) for stack in stacks) >= TREAP_MIN_CRATES:
+        return rearrange_crates_treaps(stacks, moves, retain_orders)
+
+    # stacks of every mode, copied one level deep as crates are immutable strings
+    mode_stacks = [[list(stack) for stack in stacks] for _ in retain_orders]
 
-    # reset stacks
-    stacks = stacks_copy
+    # number of crates moved
+    crates_moved = 0
 
     # iterate over moves
-    for move in moves_input.split('\n'):
-        # parse current move
-        n_crates, from_idx, to_idx = parse_move(move)
-        # transfer appropriate crates
-        # set retain_order = True so multiple moved stacks are moved in order
-        transfer_crates(stacks[from_idx], stacks[to_idx], n_crates, retain_order=True)
+    for n_crates, from_idx, to_idx in moves:
+        for retain_order, stacks in zip(retain_orders, mode_stacks):
+            # transfer appropriate crates
+            transfer_crates(stacks[from_idx], stacks[to_idx], n_crates, retain_order=retain_order)
+
+        crates_moved += n_crates
+
+    count('moves', len(moves))
+    count('crates_moved', crates_moved)
 
     # join top elements of stacks
-    print(''.join([i[-1] for i in stacks]))
+    return [''.join([i[-1] for i in stacks]) for stacks in mode_stacks]
+
+
+def rearrange_crates_treaps(
+    stacks: list[list[str]],
+    moves: list[tuple[int, int, int]],
+    retain_orders: list[bool],
+) -> list[str]:
+    """
+    Same as rearrange_crates, but with stacks kept as treaps, so moves take expected
+    logarithmic time however many crates they transfer.
+    """
+    treaps = CrateTreaps()
+    mode_roots = [[treaps.build(stack) for stack in stacks] for _ in retain_orders]
+
+    # number of crates moved
+    crates_moved = 0
+
+    for n_crates, from_idx, to_idx in moves:
+        for retain_order, roots in zip(retain_orders, mode_roots):
+            treaps.transfer(roots, from_idx, to_idx, n_crates, retain_order=retain_order)
+
+        crates_moved += n_crates
+
+    count('moves', len(moves))
+    count('crates_moved', crates_moved)
+
+    return [''.join([treaps.top(root) for root in roots]) for roots in mode_roots]
+
+
+def part1(stacks_and_moves: tuple[list[list[str]], list[tuple[int, int, int]]]) -> str:
+    # set retain_order = False so multiple moved stacks are moved in reverse order
+    return rearrange_crates(*stacks_and_moves, retain_orders=(False,))[0]
+
+
+def part2(stacks_and_moves: tuple[list[list[str]], list[tuple[int, int, int]]]) -> str:
+    # set retain_order = True so multiple moved stacks are moved in order
+    return rearrange_crates(*stacks_and_moves, retain_orders=(True,))[0]
+
+
+if __name__ == '__main__':
+    stacks_and_moves = parse(INPUT_FILE_PATH)
+
+    # both parts are simulated together in a single pass over moves
+    for top_crates in rearrange_crates(*stacks_and_moves):
+        print(top_crates)
@@ -1,35 +1,190 @@
-from collections import Counter
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import CHUNK_SIZE, map_bytes, read_chars
+from aoc.instrumentation import count
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# numpy is only imported once a solution first uses it
+np = lazy_import('numpy')
+
+# file with input signal
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'signal.txt')
+
+
+def parse(file_path: str) -> str:
+    """
+    Parse file into signal string.
+    """
+    # join signal read in chunks, ignoring line endings
+    signal = ''.join(read_chars(file_path, width=CHUNK_SIZE)).strip()
+
+    return signal
+
+
+def find_markers(signal: Iterable[str], window_sizes: Iterable[int]) -> dict[int, int | None]:
+    """
+    Find number of characters processed before the first window of unique
+    characters is complete, for every given window size, in a single pass over
+    signal. Signal can be a string or any stream of characters, such as read_chars
+    of the signal file.
+    """
+    # window sizes in increasing order, as longer windows of unique characters are
+    # never complete before shorter ones
+    pending = sorted(set(window_sizes))
+    if len(pending) == 0 or pending[0] < 1:
+        raise ValueError(f'Invalid window sizes {window_sizes}')
+
+    markers = {window_size: None for window_size in pending}
+    # index of last occurrence of every character, indexed by character code
+    last_seen = [-1] * 128
+    # start of longest run of unique characters ending at current character
+    start = 0
+    i = -1
+
+    for i, char in enumerate(signal):
+        code = ord(char)
+        if code >= len(last_seen):
+            last_seen.extend([-1] * (code + 1 - len(last_seen)))
+
+        # run of unique characters restarts after previous occurrence of character
+        if last_seen[code] >= start:
+            start = last_seen[code] + 1
+
+        last_seen[code] = i
+
+        # run of unique characters completes windows up to its length
+        while i - start + 1 >= pending[0]:
+            markers[pending.pop(0)] = i + 1
+            if len(pending) == 0:
+                count('characters_scanned', i + 1)
+                return markers
+
+    count('characters_scanned', i + 1)
+
+    return markers
+
+
+def find_marker(signal: Iterable[str], window_size: int) -> int | None:
+    """
+    Find number of characters processed before the first window of given number of
+    unique characters is complete.
+    """
+    return find_markers(signal, (window_size,))[window_size]
+
+
+def stream_markers(
+    file_path: str,
+    window_size: int,
+    all_markers: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[int]:
+    """
+    Scan memory-mapped signal file for markers, yielding number of characters
+    processed before every completed window of given number of unique characters,
+    or only the first one unless all_markers is set. Line endings are ignored and
+    only one chunk is held in memory at a time, however big the file.
+    """
+    if window_size < 1:
+        raise ValueError(f'Invalid window size {window_size}')
+
+    # index of last occurrence of every byte, carried across chunks so windows
+    # straddling chunk boundaries are found without rereading any bytes
+    last_seen = [-1] * 256
+    # start of longest run of unique characters ending at current character
+    start = 0
+    # number of characters processed before current chunk
+    offset = 0
+    n_markers = 0
+
+    with map_bytes(file_path) as mapped:
+        for chunk_start in range(0, len(mapped), chunk_size):
+            chunk = mapped[chunk_start : chunk_start + chunk_size].translate(None, b'\r\n')
+
+            for i, code in enumerate(chunk, offset):
+                # run of unique characters restarts after previous occurrence of character
+                if last_seen[code] >= start:
+                    start = last_seen[code] + 1
+
+                last_seen[code] = i
+
+                if i - start + 1 >= window_size:
+                    n_markers += 1
+                    yield i + 1
+
+                    if not all_markers:
+                        count('characters_scanned', i + 1)
+                        return
+
+            offset += len(chunk)
+
+    count('characters_scanned', offset)
+    count('markers', n_markers)
+
+
+def find_all_markers(signal: str | bytes, window_size: int) -> npt.NDArray[np.int64]:
+    """
+    Find number of characters processed before every completed window of given
+    number of unique characters, all at once. Window ending at a character is unique
+    if no character since its start occurred before, i.e. if the longest run of
+    unique characters ending there is at least as long as the window.
+    """
+    if window_size < 1:
+        raise ValueError(f'Invalid window size {window_size}')
+
+    if isinstance(signal, str):
+        signal = signal.encode()
+
+    codes = np.frombuffer(signal, dtype=np.uint8)
+
+    # index of previous occurrence of every character, found one symbol at a time
+    previous = np.full(codes.shape[0], -1, dtype=np.int64)
+    for code in np.flatnonzero(np.bincount(codes, minlength=256)):
+        positions = np.flatnonzero(codes == code)
+        previous[positions[1:]] = positions[:-1]
+
+    # start of longest run of unique characters ending at every character
+    starts = np.maximum.accumulate(previous + 1)
+    run_lengths = np.arange(1, codes.shape[0] + 1) - starts
+
+    markers = np.flatnonzero(run_lengths >= window_size) + 1
+    count('characters_scanned', codes.shape[0])
+    count('markers', markers.shape[0])
+
+    return markers
+
+
+def batch_find_markers(signals: Iterable[str | bytes], window_size: int) -> list[npt.NDArray[np.int64]]:
+    """
+    Find every marker position of each of many signals.
+    """
+    return [find_all_markers(signal, window_size) for signal in signals]
+
+
+def part1(signal: str) -> int | None:
+    return find_marker(signal, 4)
+
+
+def part2(signal: str) -> int | None:
+    return find_marker(signal, 14)
 
 
 if __name__ == '__main__':
-    # file with input signal
-    file_path = '../signal.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
-
-    # get signal string
-    signal = file_contents.strip()
-    # number of unique characters to look for
-    window_size = 14
-    # character counter
-    counter = Counter(signal[:window_size])
-
-    # if first window is completely unique, print window size and exit
-    if len(counter) == window_size:
-        print(window_size)
-        exit()
-
-    # iterate over windows
-    for i in range(window_size, len(signal) - window_size + 1):
-        # increment counter for character to the right of the window
-        counter[signal[i]] += 1
-        # decrement counter for character to the left of the window
-        counter[signal[i - window_size]] -= 1
-        if counter[signal[i - window_size]] == 0:
-            del counter[signal[i - window_size]]
-
-        # if desired number of unique characters found, print and break
-        if len(counter) == window_size:
-            print(i + 1)
-            break
+    signal = parse(INPUT_FILE_PATH)
+
+    # both parts are found together in a single pass over signal
+    markers = find_markers(signal, (4, 14))
+    print(markers[4])
+    print(markers[14])
@@ -1,4 +1,22 @@
 from __future__ import annotations
+import os
+import sys
+
+
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import read_lines
+from aoc.instrumentation import count
+
+# file with filesystem data
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'filesystem.txt')
+
+TOTAL_DISK_SPACE = 70000000
+REQUIRED_DISK_SPACE = 30000000
+DIRECTORY_SIZE_THRESHOLD = 100000
 
 
 class Directory:
@@ -11,6 +29,17 @@ class Directory:
         self.subdirectories = []
         # dictonary of file names to file sizes
         self.files = {}
+        # total size of directory's contents, kept up to date as contents are added
+        self.size = 0
+
+    def propagate_size(self, size_change: int):
+        """
+        Apply change in size of contents to Directory and all of its ancestors.
+        """
+        directory = self
+        while directory is not None:
+            directory.size += size_change
+            directory = directory.parent_directory
 
     def add_subdirectory(self, subdirectory: Directory):
         """
@@ -19,13 +48,21 @@ class Directory:
         if id(self) == id(subdirectory):
             raise ValueError('cannot add self as subdirectory')
 
+        if subdirectory.parent_directory is not None and subdirectory.parent_directory is not self:
+            raise ValueError(f'directory {subdirectory.name} already has another parent directory')
+
+        subdirectory.parent_directory = self
         self.subdirectories.append(subdirectory)
+        # subdirectory may already have contents of its own
+        self.propagate_size(subdirectory.size)
 
     def add_file(self, filename: str, filesize: int):
         """
-        Add file with name and size.
+        Add file with name and size, replacing size of file with the same name.
         """
+        size_change = filesize - self.files.get(filename, 0)
         self.files[filename] = filesize
+        self.propagate_size(size_change)
 
     def get_subdirectory(self, sub_dirname: str) -> Directory:
         """
@@ -47,32 +84,38 @@ class Directory:
 
     def compute_size(self: Directory) -> int:
         """
-        Recursively compute size of Directory's contents.
+        Get size of Directory's contents, which is kept up to date incrementally.
         """
-        total_size = 0
+        count('compute_size_calls')
 
-        # recursively compute sizes of subdirectories
-        for subdirectory in self.subdirectories:
-            total_size += subdirectory.compute_size()
+        return self.size
 
-        # compute sizes of files
-        for filesize in self.files.values():
-            total_size += filesize
+    def recompute_sizes(self):
+        """
+        Recompute sizes of Directory and every directory below it from scratch, in a
+        single bottom-up pass over all entries.
+        """
+        # directories in order of discovery, so every directory comes before its subdirectories
+        directories = [self]
+        for directory in directories:
+            directories.extend(directory.subdirectories)
 
-        return total_size
+        for directory in directories:
+            directory.size = sum(directory.files.values())
 
+        # children are done before their parents when walking discovery order backwards
+        for directory in reversed(directories):
+            for subdirectory in directory.subdirectories:
+                directory.size += subdirectory.size
 
-if __name__ == '__main__':
-    # file with filesystem data
-    file_path = '../filesystem.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
+        count('directories_recomputed', len(directories))
 
-    TOTAL_DISK_SPACE = 70000000
-    REQUIRED_DISK_SPACE = 30000000
-    DIRECTORY_SIZE_THRESHOLD = 100000
 
+def parse(file_path: str) -> list[Directory]:
+    """
+    Parse terminal output in file into list of navigated directories, starting with
+    root directory.
+    """
     # create root directory
     root = Directory(name='/')
     # list of directories navigated
@@ -82,7 +125,7 @@ if __name__ == '__main__':
     # represents whether or not to expect ls command output
     ls_mode = False
 
-    for line in file_contents.splitlines():
+    for line in read_lines(file_path):
         line_split = line.split()
 
         # if line is a command (i.e. cd, ls)
@@ -127,16 +170,33 @@ if __name__ == '__main__':
         else:
             raise ValueError(f'encountered non-command input {line} while ls_mode = False')
 
+    count('directories', len(navigated_directories))
+
+    return navigated_directories
+
+
+def part1(navigated_directories: list[Directory]) -> int:
     # compute sizes of navigated directories
     navigated_directory_sizes = [d.compute_size() for d in navigated_directories]
     # get sum of directory sizes under threshold
-    print(sum([size for size in navigated_directory_sizes if size <= DIRECTORY_SIZE_THRESHOLD]))
+    return sum([size for size in navigated_directory_sizes if size <= DIRECTORY_SIZE_THRESHOLD])
+
 
+def part2(navigated_directories: list[Directory]) -> int:
+    # compute sizes of navigated directories
+    navigated_directory_sizes = [d.compute_size() for d in navigated_directories]
     # compute size of root directory
-    total_size = root.compute_size()
+    total_size = navigated_directories[0].compute_size()
     # compute unused space
     unused_space = TOTAL_DISK_SPACE - total_size
     # compute amount of space needed
     extra_space_needed = REQUIRED_DISK_SPACE - unused_space
     # get size of smallest directory that can be removed to get space needed
-    print(min([size for size in navigated_directory_sizes if size >= extra_space_needed]))
+    return min([size for size in navigated_directory_sizes if size >= extra_space_needed])
+
+
+if __name__ == '__main__':
+    navigated_directories = parse(INPUT_FILE_PATH)
+
+    print(part1(navigated_directories))
+    print(part2(navigated_directories))
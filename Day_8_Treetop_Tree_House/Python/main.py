@@ -1,6 +1,27 @@
-import numpy as np
-import numpy.typing as npt
-from typing import Any
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING, Any
+
+
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.grid import read_grid
+from aoc.instrumentation import count
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# numpy is only imported once a solution first uses it
+np = lazy_import('numpy')
+
+# file with trees data
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'trees.txt')
 
 
 def is_cumulative_max(A: npt.NDArray[Any]) -> npt.NDArray[bool]:
@@ -25,18 +46,17 @@ def n_first_consecutive(A: npt.NDArray[Any]) -> int:
     return where[0]
 
 
-if __name__ == '__main__':
-    # file with trees data
-    file_path = '../trees.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
-
-    # create 2d array of tree heights
-    trees = np.array(
-        [list(line) for line in file_contents.split() if len(line) > 0],
-        dtype=np.int8,
-    )
+def parse(file_path: str) -> npt.NDArray[np.int8]:
+    """
+    Parse file into 2d array of tree heights.
+    """
+    # create 2d array of tree heights, converting all digits at once
+    trees = (read_grid(file_path) - ord('0')).astype(np.int8)
+
+    return trees
+
+
+def part1(trees: npt.NDArray[np.int8]) -> int:
     # get tree grid dimensions
     l, w = trees.shape
     # set of coordinates of non-bordering trees visible from at least one side
@@ -69,7 +89,13 @@ if __name__ == '__main__':
     n_bordering_trees = 2 * (l + w - 2)
     # number of all visible trees
     n_visible_trees = len(non_bordering_visible) + n_bordering_trees
-    print(n_visible_trees)
+
+    return n_visible_trees
+
+
+def part2(trees: npt.NDArray[np.int8]) -> int:
+    # get tree grid dimensions
+    l, w = trees.shape
 
     max_scenic_score = 0
     # iterate of rows
@@ -88,4 +114,13 @@ if __name__ == '__main__':
             if scenic_score > max_scenic_score:
                 max_scenic_score = scenic_score
 
-    print(max_scenic_score)
+    count('scenic_scores', l * w)
+
+    return int(max_scenic_score)
+
+
+if __name__ == '__main__':
+    trees = parse(INPUT_FILE_PATH)
+
+    print(part1(trees))
+    print(part2(trees))
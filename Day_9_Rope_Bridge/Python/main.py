@@ -1,4 +1,25 @@
-from typing import Tuple
+import os
+import sys
+from typing import List, Tuple
+
+
+# repository root, added to import path for shared aoc package
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from aoc.readers import read_lines
+from aoc.instrumentation import count
+
+# file with rope motions data
+INPUT_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'rope_motions.txt')
+# dictionary for converting direction letter into movement direction
+DIRECTIONS_MAP = {
+    'U': (0, 1),
+    'D': (0, -1),
+    'R': (1, 0),
+    'L': (-1, 0),
+}
 
 
 # object representing knots of a rope
@@ -61,35 +82,54 @@ class Rope:
             x2, y2 = x1, y1
 
 
-if __name__ == '__main__':
-    # dictionary for converting direction letter into movement direction
-    DIRECTIONS_MAP = {
-        'U': (0, 1),
-        'D': (0, -1),
-        'R': (1, 0),
-        'L': (-1, 0),
-    }
-    # length of rope
-    length = 10
-    # create role of given length
-    rope = Rope(length=length)
-
-    # file with rope motions data
-    file_path = '../rope_motions.txt'
-    # open and read file
-    with open(file_path) as f:
-        file_contents = f.read()
-
-    for motion in file_contents.splitlines():
+def parse(file_path: str) -> List[Tuple[int, int, int]]:
+    """
+    Parse file into list of movement directions and number of steps.
+    """
+    motions = []
+    for motion in read_lines(file_path):
         direction, steps = motion.split()
-        steps = int(steps)
-
         # get movement direction
         delx, dely = DIRECTIONS_MAP[direction]
+        motions.append((delx, dely, int(steps)))
+
+    return motions
+
+
+def tail_visited_count(motions: List[Tuple[int, int, int]], length: int) -> int:
+    """
+    Move rope of given length and get number of coordinates visited by tail knot.
+    """
+    # create rope of given length
+    rope = Rope(length=length)
+
+    # number of single steps moved
+    n_steps = 0
 
+    for delx, dely, steps in motions:
         # move rope step-by-step
         for step in range(steps):
             rope.move(delx, dely)
 
+        n_steps += steps
+
+    count('rope_moves', n_steps)
+    count('visited_coordinates', sum([len(visited) for visited in rope.visited]))
+
     # get number of visited coordinates for tail knot
-    print(len(rope.visited[length - 1]))
+    return len(rope.visited[length - 1])
+
+
+def part1(motions: List[Tuple[int, int, int]]) -> int:
+    return tail_visited_count(motions, 2)
+
+
+def part2(motions: List[Tuple[int, int, int]]) -> int:
+    return tail_visited_count(motions, 10)
+
+
+if __name__ == '__main__':
+    motions = parse(INPUT_FILE_PATH)
+
+    print(part1(motions))
+    print(part2(motions))
@@ -0,0 +1,3 @@
+"""
+Shared tooling for importing, running and timing the Day_N Python solutions.
+"""
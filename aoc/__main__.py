@@ -0,0 +1,46 @@
+import argparse
+
+from aoc.cache import clear_cache
+from aoc.profiling import PROFILES_DIR, profile_day, write_profile
+from aoc.runner import run_days, format_result
+from aoc.solvers import find_days
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog='python -m aoc',
+        description='Run and time Advent of Code 2022 Python solutions.',
+    )
+    parser.add_argument('-d', '--day', type=int, nargs='+', dest='days', help='days to run, defaults to all days')
+    parser.add_argument('-p', '--part', type=int, nargs='+', dest='parts', choices=(1, 2), default=[1, 2], help='parts to solve')
+    parser.add_argument('-i', '--input', dest='file_path', help='input file path, defaults to the day\'s own input')
+    parser.add_argument('-c', '--cache', action='store_true', help='load and store parsed inputs in on-disk cache')
+    parser.add_argument('--clear-cache', action='store_true', help='remove all cached parsed inputs and exit')
+    parser.add_argument('--profile', action='store_true', help='write JSON profile report per day with counters and timers')
+    parser.add_argument('--cprofile', action='store_true', help='include cProfile data in profile reports')
+    parser.add_argument('--tracemalloc', action='store_true', help='include tracemalloc data in profile reports')
+    parser.add_argument('--profiles-dir', default=PROFILES_DIR, help='directory to write profile reports to')
+    args = parser.parse_args()
+
+    if args.clear_cache:
+        print(f'Removed {clear_cache()} cached parsed inputs')
+        exit()
+
+    if args.file_path is not None and (args.days is None or len(args.days) != 1):
+        parser.error('--input requires exactly one --day')
+
+    if args.profile:
+        for day in (args.days if args.days is not None else find_days().keys()):
+            report = profile_day(
+                day,
+                parts=args.parts,
+                file_path=args.file_path,
+                use_cprofile=args.cprofile,
+                use_tracemalloc=args.tracemalloc,
+            )
+            print(f'Day {day}: wrote {write_profile(report, profiles_dir=args.profiles_dir)}')
+
+        exit()
+
+    for result in run_days(days=args.days, parts=args.parts, file_path=args.file_path, use_cache=args.cache):
+        print(format_result(result))
@@ -0,0 +1,126 @@
+import os
+import time
+import argparse
+import traceback
+from typing import Any, Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc.lazy import preload_all
+from aoc.runner import run_day, format_result
+from aoc.solvers import load_solver
+
+
+def _init_worker(days: Iterable[int]):
+    """
+    Import solvers of all days in the batch once per worker process, finishing their
+    deferred imports, so heavy modules such as numpy are imported before the first
+    job and reused after. Days whose solvers fail to load, such as days without a
+    solution, are skipped, so their jobs report the error on their own instead of
+    breaking every worker.
+    """
+    for day in days:
+        try:
+            load_solver(day)
+        except Exception:
+            continue
+
+    preload_all()
+
+
+def _run_job(job: tuple[int, str], parts: tuple[int, ...], use_cache: bool) -> dict[str, Any]:
+    """
+    Run single (day, input file path) job, recording wall time, worker process and
+    any error raised instead of aborting the whole batch.
+    """
+    day, file_path = job
+    start = time.perf_counter()
+
+    try:
+        result = run_day(day, parts=parts, file_path=file_path, use_cache=use_cache)
+    except Exception:
+        result = {
+            'day': day,
+            'file_path': file_path,
+            'error': traceback.format_exc(),
+        }
+
+    result['wall_time'] = time.perf_counter() - start
+    result['worker_pid'] = os.getpid()
+
+    return result
+
+
+def run_batch(
+    jobs: Iterable[tuple[int, str]],
+    parts: Iterable[int] = (1, 2),
+    max_workers: int | None = None,
+    use_cache: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Run (day, input file path) jobs across a pool of worker processes. Results are
+    returned in the same order as the jobs. Uses as many workers as CPUs if
+    max_workers is not given.
+    """
+    jobs = list(jobs)
+    parts = tuple(parts)
+    days = sorted(set(day for day, _ in jobs))
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(days,),
+    ) as executor:
+        results = list(executor.map(_run_job, jobs, [parts] * len(jobs), [use_cache] * len(jobs)))
+
+    return results
+
+
+def parse_job(job: str) -> tuple[int, str]:
+    """
+    Parse job given as "DAY:PATH".
+    """
+    day, sep, file_path = job.partition(':')
+    if sep == '' or not day.isdigit() or file_path == '':
+        raise ValueError(f'invalid job {job}, expected DAY:PATH')
+
+    return int(day), file_path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog='python -m aoc.batch',
+        description='Run many (day, input file) jobs across a pool of worker processes.',
+    )
+    parser.add_argument('jobs', nargs='*', help='jobs given as DAY:PATH')
+    parser.add_argument('-f', '--jobs-file', help='file with one DAY:PATH job per line')
+    parser.add_argument('-p', '--part', type=int, nargs='+', dest='parts', choices=(1, 2), default=[1, 2], help='parts to solve')
+    parser.add_argument('-w', '--workers', type=int, help='number of worker processes, defaults to number of CPUs')
+    parser.add_argument('-c', '--cache', action='store_true', help='load and store parsed inputs in on-disk cache')
+    args = parser.parse_args()
+
+    jobs = list(args.jobs)
+    if args.jobs_file is not None:
+        with open(args.jobs_file) as f:
+            jobs += [line.strip() for line in f if len(line.strip()) > 0]
+
+    try:
+        jobs = [parse_job(job) for job in jobs]
+    except ValueError as e:
+        parser.error(str(e))
+
+    if len(jobs) == 0:
+        parser.error('no jobs given')
+
+    start = time.perf_counter()
+    results = run_batch(jobs, parts=args.parts, max_workers=args.workers, use_cache=args.cache)
+    total_time = time.perf_counter() - start
+
+    for result in results:
+        if 'error' in result:
+            print(f'Day {result["day"]} ({result["file_path"]}) failed:\n{result["error"]}')
+        else:
+            print(format_result(result))
+
+        print(f'  Wall time: {result["wall_time"] * 1000:.3f} ms (worker {result["worker_pid"]})')
+
+    print(f'Total: {len(results)} jobs in {total_time * 1000:.3f} ms')
@@ -0,0 +1,245 @@
+import os
+import math
+import json
+import time
+import argparse
+import platform
+from typing import Any, Iterable
+
+from aoc.generators import GENERATORS, generate_input
+from aoc.memory import measure_day, format_memory
+from aoc.runner import run_day
+from aoc.solvers import ROOT_DIR, find_days
+
+
+# directory with benchmark inputs, results and baselines
+BENCHMARKS_DIR = os.path.join(ROOT_DIR, 'benchmarks')
+# directory generated inputs are cached in
+INPUTS_DIR = os.path.join(BENCHMARKS_DIR, 'inputs')
+# default file to write benchmark results to
+RESULTS_FILE_PATH = os.path.join(BENCHMARKS_DIR, 'results.json')
+# default input scale factors
+DEFAULT_SCALES = (1, 10, 100)
+# scaling exponent above which growth is reported as superlinear
+SUPERLINEAR_EXPONENT = 1.5
+# number of timed runs of calibration workload, fastest is kept
+CALIBRATION_REPEAT = 10
+# size of calibration workload
+CALIBRATION_SIZE = 100000
+
+
+def calibrate(repeat: int = CALIBRATION_REPEAT) -> float:
+    """
+    Time fixed pure Python workload of integer arithmetic, list and dict operations,
+    as a measure of how fast the current machine runs Python right now. Benchmarks
+    recorded on different machines or under different load are compared relative to
+    it.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        values = [i * i % 1000 for i in range(CALIBRATION_SIZE)]
+        counts = {}
+        for value in values:
+            counts[value] = counts.get(value, 0) + 1
+
+        sorted(values)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def get_input_path(day: int, scale: int, seed: int = 0, inputs_dir: str = INPUTS_DIR) -> str:
+    """
+    Get path of generated input of given day and scale, generating it if it does
+    not exist yet.
+    """
+    os.makedirs(inputs_dir, exist_ok=True)
+    file_path = os.path.join(inputs_dir, f'day_{day}_x{scale}_seed{seed}.txt')
+
+    if not os.path.isfile(file_path):
+        # generate into temporary file so interrupted runs don't leave partial inputs
+        tmp_file_path = file_path + '.tmp'
+        generate_input(day, scale, tmp_file_path, seed=seed)
+        os.replace(tmp_file_path, file_path)
+
+    return file_path
+
+
+def scaling_exponent(sizes: list[float], times: list[float]) -> float | None:
+    """
+    Estimate exponent k in time ~ size^k with a least squares fit on log-log scale.
+    Returns None if there are fewer than two distinct sizes.
+    """
+    points = [(math.log(s), math.log(t)) for s, t in zip(sizes, times) if s > 0 and t > 0]
+    if len(set(x for x, _ in points)) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+
+    return covariance / variance
+
+
+def benchmark_day(
+    day: int,
+    scales: Iterable[int] = DEFAULT_SCALES,
+    parts: Iterable[int] = (1, 2),
+    repeat: int = 1,
+    seed: int = 0,
+    inputs_dir: str = INPUTS_DIR,
+    memory: bool = False,
+) -> dict[str, Any]:
+    """
+    Run day on generated inputs of each scale, keeping the fastest of repeated runs,
+    and compute throughput and scaling exponents. If memory is set, peak RSS and top
+    traced allocations are also measured for each scale in a separate process.
+    """
+    parts = list(parts)
+    runs = []
+
+    for scale in scales:
+        file_path = get_input_path(day, scale, seed=seed, inputs_dir=inputs_dir)
+        input_bytes = os.path.getsize(file_path)
+
+        results = [run_day(day, parts=parts, file_path=file_path) for _ in range(repeat)]
+        parse_time = min(result['parse_time'] for result in results)
+
+        run = {
+            'scale': scale,
+            'input_bytes': input_bytes,
+            'parse_time': parse_time,
+            'parse_throughput': input_bytes / parse_time if parse_time > 0 else None,
+            'parts': {},
+        }
+
+        for part in parts:
+            solve_time = min(result['parts'][part]['solve_time'] for result in results)
+            run['parts'][str(part)] = {
+                'answer': str(results[0]['parts'][part]['answer']),
+                'solve_time': solve_time,
+                'throughput': input_bytes / solve_time if solve_time > 0 else None,
+            }
+
+        if memory:
+            run['memory'] = measure_day(day, file_path, parts=parts)
+
+        runs.append(run)
+
+    # fit scaling curves against input size
+    sizes = [run['input_bytes'] for run in runs]
+    scaling = {'parse': scaling_exponent(sizes, [run['parse_time'] for run in runs])}
+    for part in parts:
+        scaling[f'part{part}'] = scaling_exponent(sizes, [run['parts'][str(part)]['solve_time'] for run in runs])
+
+    return {
+        'runs': runs,
+        'scaling': scaling,
+    }
+
+
+def run_benchmarks(
+    days: Iterable[int] | None = None,
+    scales: Iterable[int] = DEFAULT_SCALES,
+    parts: Iterable[int] = (1, 2),
+    repeat: int = 1,
+    seed: int = 0,
+    inputs_dir: str = INPUTS_DIR,
+    memory: bool = False,
+) -> dict[str, Any]:
+    """
+    Benchmark multiple days, defaulting to every day with both a Python solution
+    and an input generator.
+    """
+    if days is None:
+        days = [day for day in find_days() if day in GENERATORS]
+
+    scales = list(scales)
+    parts = list(parts)
+
+    benchmarks = {
+        'python_version': platform.python_version(),
+        'machine': platform.machine(),
+        'scales': scales,
+        'parts': parts,
+        'repeat': repeat,
+        'seed': seed,
+        'memory': memory,
+        'calibration_time': calibrate(),
+        'days': {},
+    }
+
+    for day in days:
+        benchmarks['days'][str(day)] = benchmark_day(
+            day,
+            scales=scales,
+            parts=parts,
+            repeat=repeat,
+            seed=seed,
+            inputs_dir=inputs_dir,
+            memory=memory,
+        )
+
+    return benchmarks
+
+
+def format_benchmarks(benchmarks: dict[str, Any]) -> str:
+    """
+    Format benchmark results into human readable table.
+    """
+    lines = [f'{"day":>4} {"scale":>7} {"bytes":>12} {"stage":>6} {"time (ms)":>12} {"MB/s":>10}']
+
+    for day, day_benchmarks in benchmarks['days'].items():
+        for run in day_benchmarks['runs']:
+            stages = [('parse', run['parse_time'], run['parse_throughput'])]
+            stages += [(f'part{part}', r['solve_time'], r['throughput']) for part, r in run['parts'].items()]
+
+            for stage, stage_time, throughput in stages:
+                throughput = f'{throughput / 1e6:10.3f}' if throughput is not None else f'{"-":>10}'
+                lines.append(
+                    f'{day:>4} {run["scale"]:>7} {run["input_bytes"]:>12} {stage:>6} {stage_time * 1000:12.3f} {throughput}'
+                )
+
+            if 'memory' in run:
+                lines.append(f'{day:>4} {run["scale"]:>7} {run["input_bytes"]:>12} memory {format_memory(run["memory"])}')
+
+        for stage, exponent in day_benchmarks['scaling'].items():
+            if exponent is not None and exponent > SUPERLINEAR_EXPONENT:
+                lines.append(f'{day:>4} warning: {stage} scales superlinearly, time ~ size^{exponent:.2f}')
+
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog='python -m aoc.benchmark',
+        description='Benchmark Python solutions on generated inputs of increasing scale.',
+    )
+    parser.add_argument('-d', '--day', type=int, nargs='+', dest='days', help='days to benchmark, defaults to all days')
+    parser.add_argument('-p', '--part', type=int, nargs='+', dest='parts', choices=(1, 2), default=[1, 2], help='parts to solve')
+    parser.add_argument('-s', '--scale', type=int, nargs='+', dest='scales', default=list(DEFAULT_SCALES), help='input scale factors')
+    parser.add_argument('-r', '--repeat', type=int, default=1, help='number of runs per input, fastest is kept')
+    parser.add_argument('--seed', type=int, default=0, help='seed for input generation')
+    parser.add_argument('--inputs-dir', default=INPUTS_DIR, help='directory to cache generated inputs in')
+    parser.add_argument('-m', '--memory', action='store_true', help='also measure peak RSS and top traced allocations')
+    parser.add_argument('-o', '--output', default=RESULTS_FILE_PATH, help='file to write JSON results to')
+    args = parser.parse_args()
+
+    benchmarks = run_benchmarks(
+        days=args.days,
+        scales=args.scales,
+        parts=args.parts,
+        repeat=args.repeat,
+        seed=args.seed,
+        inputs_dir=args.inputs_dir,
+        memory=args.memory,
+    )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(benchmarks, f, indent=2)
+
+    print(format_benchmarks(benchmarks))
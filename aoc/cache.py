@@ -0,0 +1,166 @@
+import os
+import sys
+import glob
+import pickle
+import hashlib
+from types import ModuleType
+from typing import Any
+
+from aoc.solvers import ROOT_DIR, load_solver
+
+
+# default directory parsed inputs are cached in
+CACHE_DIR = os.path.join(ROOT_DIR, '.cache', 'parsed')
+# number of bytes hashed at a time
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(file_path: str) -> str:
+    """
+    Compute SHA-256 hash of file contents, reading it in chunks.
+    """
+    h = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(HASH_CHUNK_SIZE)
+            if len(chunk) == 0:
+                break
+
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def _is_aoc_module(name: Any) -> bool:
+    return isinstance(name, str) and (name == 'aoc' or name.startswith('aoc.'))
+
+
+def solver_dependencies(solver: ModuleType) -> list[str]:
+    """
+    Find names of aoc modules solver depends on, directly or through other aoc
+    modules, from the modules and functions in their globals.
+    """
+    # looked up by identity, as any attribute access would execute lazily imported modules
+    module_names = {id(module): name for name, module in list(sys.modules.items())}
+
+    dependencies = set()
+    modules = [solver]
+    while len(modules) > 0:
+        for value in vars(modules.pop()).values():
+            if isinstance(value, ModuleType):
+                name = module_names.get(id(value))
+            else:
+                name = getattr(value, '__module__', None)
+
+            if _is_aoc_module(name) and name not in dependencies and name in sys.modules:
+                dependencies.add(name)
+                modules.append(sys.modules[name])
+
+    return sorted(dependencies)
+
+
+def solver_digest(solver: ModuleType) -> str:
+    """
+    Compute version of solver as the hash of its source file and of the source files
+    of aoc modules it depends on, so any change to the solver or to shared code it
+    uses invalidates its cached inputs.
+    """
+    h = hashlib.sha256(file_digest(solver.__file__).encode())
+    for name in solver_dependencies(solver):
+        h.update(f'{name}:{file_digest(sys.modules[name].__file__)}'.encode())
+
+    return h.hexdigest()
+
+
+def _cache_file_prefix(day: int, input_digest: str, cache_dir: str) -> str:
+    return os.path.join(cache_dir, f'day_{day}_{input_digest[:32]}')
+
+
+def _load(cache_file_path: str) -> Any:
+    """
+    Load cached parsed input from .npz or pickle file.
+    """
+    if cache_file_path.endswith('.npz'):
+        # imported here so days without numpy grids don't need numpy
+        import numpy as np
+
+        with np.load(cache_file_path, allow_pickle=False) as npz:
+            return npz['data']
+
+    with open(cache_file_path, 'rb') as f:
+        return pickle.load(f)
+
+
+def _store(cache_file_path_prefix: str, data: Any) -> str | None:
+    """
+    Store parsed input as .npz for numpy grids and as pickle for everything else.
+    Writes to a temporary file first, so concurrent readers never see partial files.
+    Returns None without caching if parsed input is nested too deeply to pickle.
+    """
+    is_array = type(data).__module__ == 'numpy' and type(data).__name__ == 'ndarray'
+    cache_file_path = cache_file_path_prefix + ('.npz' if is_array else '.pickle')
+    tmp_file_path = f'{cache_file_path}.{os.getpid()}.tmp'
+
+    with open(tmp_file_path, 'wb') as f:
+        if is_array:
+            import numpy as np
+
+            np.savez(f, data=data)
+        else:
+            try:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except RecursionError:
+                # such as deeply nested directory trees of day 7
+                f.close()
+                os.remove(tmp_file_path)
+
+                return None
+
+    os.replace(tmp_file_path, cache_file_path)
+
+    return cache_file_path
+
+
+def cached_parse(day: int, file_path: str, cache_dir: str = CACHE_DIR) -> tuple[Any, bool]:
+    """
+    Parse input file of given day, loading parsed input from cache if the same file
+    contents were already parsed by the same solver version. Returns parsed input and
+    whether it was loaded from cache.
+    """
+    solver = load_solver(day)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    prefix = _cache_file_prefix(day, file_digest(file_path), cache_dir)
+    version = solver_digest(solver)[:32]
+
+    for cache_file_path in glob.glob(f'{prefix}_*'):
+        # skip temporary files of concurrent writers
+        if cache_file_path.endswith('.tmp'):
+            continue
+
+        # remove entries cached by other versions of the solver
+        if not os.path.basename(cache_file_path).startswith(os.path.basename(f'{prefix}_{version}.')):
+            try:
+                os.remove(cache_file_path)
+            except FileNotFoundError:
+                pass
+
+            continue
+
+        return _load(cache_file_path), True
+
+    data = solver.parse(file_path)
+    _store(f'{prefix}_{version}', data)
+
+    return data, False
+
+
+def clear_cache(cache_dir: str = CACHE_DIR) -> int:
+    """
+    Remove all cached parsed inputs and return number of removed files.
+    """
+    cache_file_paths = glob.glob(os.path.join(cache_dir, 'day_*'))
+    for cache_file_path in cache_file_paths:
+        os.remove(cache_file_path)
+
+    return len(cache_file_paths)
@@ -0,0 +1,514 @@
+import math
+import random
+import string
+from typing import Callable, Iterable, Iterator, TextIO
+
+
+def _write_lines(f: TextIO, lines: Iterable[str], separator: str = '\n'):
+    """
+    Write lines separated by newlines, or blank lines for multi-line records, without
+    a trailing newline, matching the format of the checked-in input files.
+    """
+    for i, line in enumerate(lines):
+        if i > 0:
+            f.write(separator)
+
+        f.write(line)
+
+
+def _valve_name(i: int) -> str:
+    """
+    Get two letter valve name for given index, skipping "AA" which is reserved for
+    the source valve.
+    """
+    i += 1
+
+    return string.ascii_uppercase[i // 26] + string.ascii_uppercase[i % 26]
+
+
+def generate_calories(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 1: 250 elves per unit of scale, each carrying 1 to 15 food items.
+    """
+    def groups() -> Iterator[str]:
+        for _ in range(250 * scale):
+            yield '\n'.join([str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15))])
+
+    _write_lines(f, groups(), separator='\n\n')
+
+
+def generate_rock_paper_scissors(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 2: 2500 rounds per unit of scale.
+    """
+    _write_lines(f, (f'{rng.choice("ABC")} {rng.choice("XYZ")}' for _ in range(2500 * scale)))
+
+
+def generate_rucksacks(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 3: 100 groups of three rucksacks per unit of scale. Each rucksack has exactly
+    one item shared by its compartments and each group has exactly one badge item.
+    """
+    items = string.ascii_letters
+
+    def rucksacks() -> Iterator[str]:
+        for _ in range(100 * scale):
+            # badge, and 17 items private to each rucksack in the group
+            shuffled = rng.sample(items, len(items))
+            badge = shuffled[0]
+
+            for k in range(3):
+                private_items = shuffled[1 + 17 * k : 18 + 17 * k]
+                # item duplicated across compartments
+                duplicate = private_items[0]
+                half_len = rng.randint(8, 16)
+
+                compartment1 = [duplicate, badge] + rng.choices(private_items[1:9], k=half_len - 2)
+                compartment2 = [duplicate] + rng.choices(private_items[9:], k=half_len - 1)
+                rng.shuffle(compartment1)
+                rng.shuffle(compartment2)
+
+                yield ''.join(compartment1 + compartment2)
+
+    _write_lines(f, rucksacks())
+
+
+def generate_camp_assignments(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 4: 1000 assignment pairs per unit of scale.
+    """
+    def assignments() -> Iterator[str]:
+        for _ in range(1000 * scale):
+            a1, a2 = sorted((rng.randint(1, 99), rng.randint(1, 99)))
+            b1, b2 = sorted((rng.randint(1, 99), rng.randint(1, 99)))
+            yield f'{a1}-{a2},{b1}-{b2}'
+
+    _write_lines(f, assignments())
+
+
+def generate_crates(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 5: 9 stacks with between 2 and 10 crates per unit of scale each, and 500
+    moves per unit of scale, each moving up to 50 crates. Moves never empty a stack.
+    """
+    n_stacks = 9
+    heights = [rng.randint(2, 10 * scale) for _ in range(n_stacks)]
+
+    # draw stack levels from the top down
+    levels = []
+    for level in range(max(heights) - 1, -1, -1):
+        crates = [f'[{rng.choice(string.ascii_uppercase)}]' if h > level else '   ' for h in heights]
+        levels.append(' '.join(crates))
+
+    levels.append(' '.join([f' {i + 1} ' for i in range(n_stacks)]))
+
+    def moves() -> Iterator[str]:
+        for _ in range(500 * scale):
+            from_idx = rng.choice([i for i in range(n_stacks) if heights[i] > 1])
+            to_idx = rng.choice([i for i in range(n_stacks) if i != from_idx])
+            n_crates = rng.randint(1, min(heights[from_idx] - 1, 50))
+
+            heights[from_idx] -= n_crates
+            heights[to_idx] += n_crates
+
+            yield f'move {n_crates} from {from_idx + 1} to {to_idx + 1}'
+
+    _write_lines(f, levels)
+    f.write('\n\n')
+    _write_lines(f, moves())
+
+
+def generate_signal(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 6: 4096 characters per unit of scale. The signal is drawn from 13 letters,
+    except for a 14 character marker placed at 85% of its length, so every window
+    is scanned before the marker is found.
+    """
+    length = 4096 * scale
+    marker_idx = int(length * 0.85)
+    alphabet = rng.sample(string.ascii_lowercase, 13)
+
+    f.write(''.join(rng.choices(alphabet, k=marker_idx)))
+    f.write(''.join(rng.sample(string.ascii_lowercase, 14)))
+    f.write(''.join(rng.choices(alphabet, k=length - marker_idx - 14)))
+
+
+def generate_filesystem(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 7: 180 directories per unit of scale, with up to 10 files each. New
+    directories are mostly nested under recently created ones, so the tree gets
+    deeper as it grows, up to a depth of 200.
+    """
+    max_depth = 200
+    # subdirectory indices, file sizes and depth for each directory
+    subdirectories = [[]]
+    files = [[rng.randint(1000, 300000) for _ in range(rng.randint(0, 10))]]
+    depths = [0]
+
+    for i in range(1, 180 * scale):
+        if rng.random() < 0.5:
+            parent = rng.randrange(max(0, i - 8), i)
+        else:
+            parent = rng.randrange(i)
+
+        # attach to root instead if tree would get too deep
+        if depths[parent] >= max_depth:
+            parent = 0
+
+        subdirectories[parent].append(i)
+        subdirectories.append([])
+        files.append([rng.randint(1000, 300000) for _ in range(rng.randint(0, 10))])
+        depths.append(depths[parent] + 1)
+
+    def terminal_output() -> Iterator[str]:
+        yield '$ cd /'
+
+        # iterative depth first traversal, with None marking the return to a parent
+        stack = [0]
+        while len(stack) > 0:
+            i = stack.pop()
+            if i is None:
+                yield '$ cd ..'
+                continue
+
+            if i != 0:
+                yield f'$ cd d{i}'
+
+            yield '$ ls'
+            for j in subdirectories[i]:
+                yield f'dir d{j}'
+
+            for k, filesize in enumerate(files[i]):
+                yield f'{filesize} f{k}.txt'
+
+            for j in reversed(subdirectories[i]):
+                stack.append(None)
+                stack.append(j)
+
+    _write_lines(f, terminal_output())
+
+
+def generate_trees(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 8: square grid of tree heights with 99 x 99 trees per unit of scale.
+    """
+    side = round(99 * math.sqrt(scale))
+    _write_lines(f, (''.join(rng.choices(string.digits, k=side)) for _ in range(side)))
+
+
+def generate_rope_motions(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 9: 2000 motions per unit of scale.
+    """
+    _write_lines(f, (f'{rng.choice("UDLR")} {rng.randint(1, 20)}' for _ in range(2000 * scale)))
+
+
+def generate_instructions(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 10: 140 instructions per unit of scale, keeping register X on screen.
+    """
+    def instructions() -> Iterator[str]:
+        X = 1
+        for _ in range(140 * scale):
+            if rng.random() < 0.3:
+                yield 'noop'
+                continue
+
+            V = rng.randint(-10, 10)
+            if X + V < 0 or X + V >= 40:
+                V = -V
+
+            X += V
+            yield f'addx {V}'
+
+    _write_lines(f, instructions())
+
+
+def generate_monkeys(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 11: 8 monkeys holding 1 to 8 items each per unit of scale. Operations only
+    add and multiply by constants, as squaring worry levels without the part 2
+    modulo makes part 1 blow up.
+    """
+    divisors = [2, 3, 5, 7, 11, 13, 17, 19]
+    rng.shuffle(divisors)
+    operations = [f'old * {rng.randint(2, 19)}' for _ in range(2)] + [f'old + {rng.randint(1, 8)}' for _ in range(6)]
+    rng.shuffle(operations)
+
+    def monkeys() -> Iterator[str]:
+        for i in range(8):
+            items = [str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8) * scale)]
+            throw_tos = rng.sample([j for j in range(8) if j != i], 2)
+
+            yield '\n'.join([
+                f'Monkey {i}:',
+                f'  Starting items: {", ".join(items)}',
+                f'  Operation: new = {operations[i]}',
+                f'  Test: divisible by {divisors[i]}',
+                f'    If true: throw to monkey {throw_tos[0]}',
+                f'    If false: throw to monkey {throw_tos[1]}',
+            ])
+
+    _write_lines(f, monkeys(), separator='\n\n')
+
+
+def generate_elevation(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 12: elevation grid with 41 x 67 points per unit of scale. Elevation rises
+    from left to right with random dips, and the middle row is a climbable path
+    from S to E.
+    """
+    l = round(41 * math.sqrt(scale))
+    w = round(67 * math.sqrt(scale))
+    mid = l // 2
+
+    def rows() -> Iterator[str]:
+        for i in range(l):
+            row = []
+            for j in range(w):
+                elevation = j * 25 // (w - 1)
+                if i != mid and rng.random() < 0.3:
+                    elevation = max(0, elevation - 1)
+
+                row.append(string.ascii_lowercase[elevation])
+
+            if i == mid:
+                row[0] = 'S'
+                row[-1] = 'E'
+
+            yield ''.join(row)
+
+    _write_lines(f, rows())
+
+
+def generate_signals(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 13: 150 packet pairs per unit of scale.
+    """
+    def packet(depth: int) -> str:
+        items = []
+        for _ in range(rng.randint(0, 5)):
+            if depth < 4 and rng.random() < 0.3:
+                items.append(packet(depth + 1))
+            else:
+                items.append(str(rng.randint(0, 10)))
+
+        return '[' + ','.join(items) + ']'
+
+    _write_lines(f, (f'{packet(0)}\n{packet(0)}' for _ in range(150 * scale)), separator='\n\n')
+
+
+def generate_rocks(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 14: 40 rock paths per unit of scale, spread evenly over the triangle sand
+    can reach. The cave gets deeper with the square root of scale, so the amount of
+    sand poured grows linearly with scale.
+    """
+    max_depth = round(170 * math.sqrt(scale))
+
+    def paths() -> Iterator[str]:
+        for _ in range(40 * scale):
+            # deeper rows are wider, so pick them proportionally more often
+            i = max(13, round(max_depth * math.sqrt(rng.random())))
+            j = rng.randint(500 - i, 500 + i)
+            path = [f'{j},{i}']
+
+            # alternate between horizontal and vertical segments
+            for k in range(rng.randint(1, 6)):
+                if k % 2 == 0:
+                    j += rng.choice((-1, 1)) * rng.randint(1, 8)
+                else:
+                    i = min(max_depth, max(13, i + rng.choice((-1, 1)) * rng.randint(1, 8)))
+
+                path.append(f'{j},{i}')
+
+            yield ' -> '.join(path)
+
+    _write_lines(f, paths())
+
+
+def generate_sensors_and_beacons(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 15: sensors covering the whole 4000000 x 4000000 search area except a single
+    distress beacon location, topped up with smaller redundant sensors to 25 sensors
+    per unit of scale.
+
+    In rotated coordinates u = x + y and v = x - y, sensor exclusion zones are
+    squares. The search area is covered by strips of squares on either side of
+    u = pu and v = pv, leaving only the distress beacon location (pu, pv) uncovered.
+    """
+    c = 4000000
+    px, py = rng.randint(c // 4, 3 * c // 4), rng.randint(c // 4, 3 * c // 4)
+    pu, pv = px + py, px - py
+    # search area bounds in rotated coordinates
+    u_lo, u_hi, v_lo, v_hi = 0, 2 * c, -c, c
+    # sensors as center and radius in rotated coordinates
+    squares = []
+
+    def strip_squares(edge: int, far_edge: int, along_low: int, along_high: int) -> Iterator[tuple[int, int, int]]:
+        """
+        Get squares with one side on edge reaching past far_edge, stacked from
+        along_low to along_high on the other axis, as (center, center along other
+        axis, radius) tuples. Both centers always have the same parity.
+        """
+        r = abs(far_edge - edge) // 2 + 1
+        center = edge + r if far_edge > edge else edge - r
+        along = along_low + r - 1
+        if (along - center) % 2 != 0:
+            along -= 1
+
+        while along - r <= along_high:
+            yield center, along, r
+            along += 2 * r
+
+    # strips where u < pu and u > pu
+    for edge, far_edge in ((pu - 1, u_lo), (pu + 1, u_hi)):
+        for su, sv, r in strip_squares(edge, far_edge, v_lo, v_hi):
+            squares.append((su, sv, r))
+
+    # strips where v < pv and v > pv
+    for edge, far_edge in ((pv - 1, v_lo), (pv + 1, v_hi)):
+        for sv, su, r in strip_squares(edge, far_edge, u_lo, u_hi):
+            squares.append((su, sv, r))
+
+    # add redundant sensors that do not cover the distress beacon location
+    while len(squares) < 25 * scale:
+        su, sv = rng.randint(u_lo, u_hi), rng.randint(v_lo, v_hi)
+        # integer coordinates require u and v to have the same parity
+        sv += (su - sv) % 2
+        distance = max(abs(su - pu), abs(sv - pv))
+        if distance < 2:
+            continue
+
+        squares.append((su, sv, rng.randint(1, min(distance - 1, c // 8))))
+
+    def lines() -> Iterator[str]:
+        for su, sv, r in squares:
+            sx, sy = (su + sv) // 2, (su - sv) // 2
+            yield f'Sensor at x={sx}, y={sy}: closest beacon is at x={sx + r}, y={sy}'
+
+    _write_lines(f, lines())
+
+
+def generate_valves(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 16: "AA" and 15 valves with non-zero flow rate, connected in a ring with a
+    few shortcuts through corridors of 1 to 3 zero flow rate valves, which makes
+    about 58 valves. Scale adds dead-end zero flow rate valves, up to the 676
+    available two letter names, since the search is exponential in the number of
+    valves with non-zero flow rate.
+    """
+    names = iter(rng.sample([_valve_name(i) for i in range(26 * 26 - 1)], 26 * 26 - 1))
+    rooms = ['AA'] + [next(names) for _ in range(15)]
+    flows = {name: rng.randint(3, 25) for name in rooms[1:]}
+    flows['AA'] = 0
+    neighbours = {name: set() for name in rooms}
+
+    def connect(a: str, b: str):
+        """
+        Connect two valves through a corridor of zero flow rate valves.
+        """
+        previous = a
+        for _ in range(rng.randint(1, 3)):
+            corridor = next(names)
+            flows[corridor] = 0
+            neighbours[corridor] = {previous}
+            neighbours[previous].add(corridor)
+            previous = corridor
+
+        neighbours[previous].add(b)
+        neighbours[b].add(previous)
+
+    shuffled_rooms = rng.sample(rooms, len(rooms))
+    for i in range(len(shuffled_rooms)):
+        connect(shuffled_rooms[i - 1], shuffled_rooms[i])
+
+    for _ in range(8):
+        connect(*rng.sample(rooms, 2))
+
+    # add dead-end valves up to the requested size
+    n_valves = min(58 * scale, 26 * 26)
+    while len(neighbours) < n_valves:
+        dead_end = next(names)
+        other = rng.choice(list(neighbours))
+        flows[dead_end] = 0
+        neighbours[dead_end] = {other}
+        neighbours[other].add(dead_end)
+
+    def lines() -> Iterator[str]:
+        for name, tunnels in neighbours.items():
+            tunnels = sorted(tunnels)
+            if len(tunnels) == 1:
+                yield f'Valve {name} has flow rate={flows[name]}; tunnel leads to valve {tunnels[0]}'
+            else:
+                yield f'Valve {name} has flow rate={flows[name]}; tunnels lead to valves {", ".join(tunnels)}'
+
+    _write_lines(f, lines())
+
+
+def generate_jet_patterns(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 17: 10091 jet patterns per unit of scale.
+    """
+    f.write(''.join(rng.choices('<>', k=10091 * scale)))
+
+
+def generate_boulders(f: TextIO, scale: int, rng: random.Random):
+    """
+    Day 18: porous ball of boulders, with air pockets, inside a cube with 22 x 22 x
+    22 points per unit of scale.
+    """
+    side = round(22 * scale ** (1 / 3))
+    center = (side - 1) / 2
+
+    def boulders() -> Iterator[str]:
+        for x in range(side):
+            for y in range(side):
+                for z in range(side):
+                    # skip points outside ball
+                    if (x - center) ** 2 + (y - center) ** 2 + (z - center) ** 2 > center ** 2:
+                        continue
+
+                    if rng.random() < 0.6:
+                        yield f'{x},{y},{z}'
+
+    _write_lines(f, boulders())
+
+
+# input generator for each day
+GENERATORS: dict[int, Callable[[TextIO, int, random.Random], None]] = {
+    1: generate_calories,
+    2: generate_rock_paper_scissors,
+    3: generate_rucksacks,
+    4: generate_camp_assignments,
+    5: generate_crates,
+    6: generate_signal,
+    7: generate_filesystem,
+    8: generate_trees,
+    9: generate_rope_motions,
+    10: generate_instructions,
+    11: generate_monkeys,
+    12: generate_elevation,
+    13: generate_signals,
+    14: generate_rocks,
+    15: generate_sensors_and_beacons,
+    16: generate_valves,
+    17: generate_jet_patterns,
+    18: generate_boulders,
+}
+
+
+def generate_input(day: int, scale: int, file_path: str, seed: int = 0):
+    """
+    Write synthetic input of given day and scale factor to file. Scale factor 1
+    produces inputs about the size of the checked-in inputs.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f'no input generator for day {day}')
+
+    if scale < 1:
+        raise ValueError(f'invalid scale factor {scale}')
+
+    rng = random.Random(f'{day}-{scale}-{seed}')
+    with open(file_path, 'w') as f:
+        GENERATORS[day](f, scale, rng)
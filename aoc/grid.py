@@ -0,0 +1,228 @@
+"""
+Compact dense 2d and 3d grids shared by the grid based days. Grids are plain numpy
+arrays, with helpers for parsing text into grids, padding so neighbour lookups never
+need bounds checks, vectorized shifts and neighbour counts, bit-packing, and
+breadth-first search and flood fill over flattened padded grids.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from aoc.instrumentation import count
+from aoc.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# numpy is only imported once a grid is first used
+np = lazy_import('numpy')
+
+
+def parse_grid(text: bytes | str) -> npt.NDArray[np.uint8]:
+    """
+    Convert rectangular text grid into 2d array of character codes, one row per
+    line. Handles both \\n and \\r\\n line endings and ignores leading and trailing
+    blank lines.
+    """
+    if isinstance(text, str):
+        text = text.encode()
+
+    text = text.replace(b'\r', b'').strip(b'\n')
+    if len(text) == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    # every row, including the last one, is followed by a newline
+    text += b'\n'
+    width = text.index(b'\n')
+    if len(text) % (width + 1) != 0:
+        raise ValueError('grid rows have different widths')
+
+    rows = np.frombuffer(text, dtype=np.uint8).reshape(-1, width + 1)
+    if not (rows[:, width] == ord('\n')).all():
+        raise ValueError('grid rows have different widths')
+
+    # copy drops newline column and gives writable contiguous array
+    return rows[:, :width].copy()
+
+
+def read_grid(file_path: str) -> npt.NDArray[np.uint8]:
+    """
+    Read file with rectangular text grid into 2d array of character codes.
+    """
+    with open(file_path, 'rb') as f:
+        return parse_grid(f.read())
+
+
+def from_coordinates(
+    coordinates: Iterable[tuple[int, ...]],
+    padding: int = 0,
+) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.int64]]:
+    """
+    Build dense boolean grid, just big enough to contain given coordinates plus
+    padding on every side. Returns grid and coordinates of the grid origin.
+    """
+    coordinates = np.array(list(coordinates), dtype=np.int64)
+    if coordinates.size == 0:
+        raise ValueError('no coordinates given')
+
+    origin = coordinates.min(axis=0) - padding
+    shape = coordinates.max(axis=0) - origin + 1 + padding
+
+    grid = np.zeros(tuple(shape), dtype=np.bool_)
+    grid[tuple((coordinates - origin).T)] = True
+
+    return grid, origin
+
+
+def pad(grid: npt.NDArray[Any], width: int = 1, value: Any = 0) -> npt.NDArray[Any]:
+    """
+    Surround grid with border of given width and value on every side.
+    """
+    return np.pad(grid, width, constant_values=value)
+
+
+def interior(padded: npt.NDArray[Any], width: int = 1) -> npt.NDArray[Any]:
+    """
+    Get view of padded grid without its border.
+    """
+    return padded[(slice(width, -width),) * padded.ndim]
+
+
+def neighbour_offsets(ndim: int) -> list[tuple[int, ...]]:
+    """
+    Get offsets of orthogonal neighbours in grid with given number of dimensions.
+    """
+    offsets = []
+    for axis in range(ndim):
+        for step in (-1, 1):
+            offset = [0] * ndim
+            offset[axis] = step
+            offsets.append(tuple(offset))
+
+    return offsets
+
+
+def shift(grid: npt.NDArray[Any], offset: tuple[int, ...], fill: Any = 0) -> npt.NDArray[Any]:
+    """
+    Shift grid by given offset, so that value at p ends up at p + offset. Values
+    shifted out are dropped and vacated cells are set to fill.
+    """
+    shifted = np.full_like(grid, fill)
+    source = []
+    destination = []
+
+    for n, o in zip(grid.shape, offset):
+        if abs(o) >= n:
+            return shifted
+
+        if o >= 0:
+            source.append(slice(0, n - o))
+            destination.append(slice(o, n))
+        else:
+            source.append(slice(-o, n))
+            destination.append(slice(0, n + o))
+
+    shifted[tuple(destination)] = grid[tuple(source)]
+
+    return shifted
+
+
+def count_neighbours(mask: npt.NDArray[np.bool_]) -> npt.NDArray[np.int8]:
+    """
+    Count orthogonal neighbours of every cell that are set in mask.
+    """
+    counts = np.zeros(mask.shape, dtype=np.int8)
+    for offset in neighbour_offsets(mask.ndim):
+        counts += shift(mask, offset, fill=False)
+
+    return counts
+
+
+def pack(mask: npt.NDArray[np.bool_]) -> bytes:
+    """
+    Pack boolean grid into bytes, using one bit per cell. The shape is not stored,
+    so it must be kept alongside if grids of different shapes are compared.
+    """
+    return np.packbits(mask, axis=None).tobytes()
+
+
+def unpack(packed: bytes, shape: tuple[int, ...]) -> npt.NDArray[np.bool_]:
+    """
+    Unpack bytes produced by pack into boolean grid of given shape.
+    """
+    n = int(np.prod(shape))
+    bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8), count=n)
+
+    return bits.reshape(shape).astype(np.bool_)
+
+
+def bfs(
+    passable: npt.NDArray[np.bool_],
+    sources: npt.NDArray[np.bool_] | Iterable[tuple[int, ...]],
+    can_step: Callable[[tuple[npt.NDArray[np.intp], ...], tuple[npt.NDArray[np.intp], ...]], npt.NDArray[np.bool_]] | None = None,
+) -> npt.NDArray[np.int64]:
+    """
+    Compute number of orthogonal steps from nearest source to every cell, moving
+    only through passable cells, one whole frontier at a time. Sources are given as a
+    boolean mask or as coordinates. If given, can_step receives source and
+    destination coordinates of candidate steps, as tuples of index arrays, and
+    returns which steps are allowed. Unreachable cells are set to -1.
+    """
+    # padded border is never passable, so steps never leave the grid
+    padded = pad(passable.astype(np.bool_), value=False)
+    flat_passable = padded.reshape(-1)
+    distances = np.full(padded.size, -1, dtype=np.int64)
+
+    # offsets of orthogonal neighbours in flattened padded grid
+    strides = [stride // padded.itemsize for stride in padded.strides]
+    offsets = np.array([sum(o * s for o, s in zip(offset, strides)) for offset in neighbour_offsets(padded.ndim)])
+
+    if isinstance(sources, np.ndarray) and sources.dtype == np.bool_:
+        frontier = np.flatnonzero(pad(sources, value=False))
+    else:
+        coordinates = np.array(list(sources), dtype=np.intp).reshape(-1, padded.ndim) + 1
+        frontier = np.unique(np.ravel_multi_index(tuple(coordinates.T), padded.shape))
+
+    frontier = frontier[flat_passable[frontier]]
+    distances[frontier] = 0
+
+    level = 0
+    while frontier.size > 0:
+        level += 1
+        candidates = (frontier[:, None] + offsets[None, :]).reshape(-1)
+        keep = flat_passable[candidates] & (distances[candidates] < 0)
+        candidates = candidates[keep]
+
+        if can_step is not None and candidates.size > 0:
+            steps_from = np.repeat(frontier, offsets.shape[0])[keep]
+            allowed = can_step(
+                tuple(i - 1 for i in np.unravel_index(steps_from, padded.shape)),
+                tuple(i - 1 for i in np.unravel_index(candidates, padded.shape)),
+            )
+            candidates = candidates[allowed]
+
+        frontier = np.unique(candidates)
+        distances[frontier] = level
+
+    distances = interior(distances.reshape(padded.shape))
+    count('bfs_levels', level)
+    count('bfs_visited', int((distances >= 0).sum()))
+
+    return distances
+
+
+def flood_fill(
+    passable: npt.NDArray[np.bool_],
+    sources: npt.NDArray[np.bool_] | Iterable[tuple[int, ...]],
+) -> npt.NDArray[np.bool_]:
+    """
+    Get mask of passable cells connected to given sources.
+    """
+    return bfs(passable, sources) >= 0
+
+
+def render(grid: npt.NDArray[Any], chars: dict[Any, str]) -> str:
+    """
+    Convert 2d grid into text, mapping each value to a character.
+    """
+    return '\n'.join([''.join([chars[v] for v in row]) for row in grid.tolist()])
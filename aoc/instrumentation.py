@@ -0,0 +1,79 @@
+"""
+Lightweight counters and timers solutions report hot path activity into. Recording is
+off by default, so instrumented solutions only pay for a flag check. Hot loops should
+count into local variables and report totals once, rather than calling count on every
+iteration.
+"""
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Iterator
+
+
+# whether or not counters and timers are recorded
+_enabled = False
+# recorded counters and accumulated timer seconds
+_counters = Counter()
+_timers = defaultdict(float)
+
+
+def enable():
+    """
+    Start recording counters and timers.
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """
+    Stop recording counters and timers.
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """
+    Clear recorded counters and timers.
+    """
+    _counters.clear()
+    _timers.clear()
+
+
+def count(name: str, n: int = 1):
+    """
+    Increment named counter by n.
+    """
+    if _enabled:
+        _counters[name] += n
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    """
+    Accumulate wall time spent inside context into named timer.
+    """
+    if not _enabled:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _timers[name] += time.perf_counter() - start
+
+
+def snapshot() -> dict[str, dict[str, int | float]]:
+    """
+    Get copy of recorded counters and timers.
+    """
+    return {
+        'counters': dict(_counters),
+        'timers': dict(_timers),
+    }
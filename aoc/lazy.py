@@ -0,0 +1,53 @@
+"""
+Deferred imports for heavy modules such as numpy, so loading a solver stays cheap
+and the import cost is only paid once the solver actually uses the module.
+"""
+import sys
+import importlib.util
+from types import ModuleType
+
+
+# names of modules imported lazily
+_lazy_modules = set()
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import module lazily, executing it on first attribute access. Returns already
+    imported module as is.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'no module named {name}', name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    _lazy_modules.add(name)
+
+    return module
+
+
+def preload(name: str) -> ModuleType:
+    """
+    Import module now, finishing any deferred import of it, so the cost is not paid
+    later on a latency sensitive path.
+    """
+    module = lazy_import(name)
+    # any attribute access executes a lazily imported module
+    getattr(module, '__name__')
+
+    return module
+
+
+def preload_all():
+    """
+    Finish every deferred import, used to warm long-lived worker processes.
+    """
+    for name in sorted(_lazy_modules):
+        preload(name)
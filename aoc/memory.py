@@ -0,0 +1,167 @@
+import sys
+import threading
+import tracemalloc
+import multiprocessing
+from typing import Any, Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows, where peak RSS is not reported
+    resource = None
+
+from aoc.profiling import TOP_N, tracemalloc_stats
+from aoc.solvers import load_solver
+
+
+# seconds between checks of traced memory while looking for peaks
+SAMPLE_INTERVAL = 0.005
+# relative growth over previous snapshot needed to take a new one
+SNAPSHOT_GROWTH = 1.1
+
+
+def peak_rss() -> int | None:
+    """
+    Get peak resident set size of current process in bytes, or None if unavailable.
+    """
+    # on Linux, ru_maxrss is kept across exec, so a spawned process would report the
+    # peak of its parent, while the high water mark in /proc starts over
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # reported in bytes on macOS and in kilobytes elsewhere
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class PeakSnapshotter(threading.Thread):
+    """
+    Background thread that takes tracemalloc snapshots as traced memory grows, so the
+    allocations alive near the peak are still known after they have been freed.
+    """
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.snapshot = None
+        self.snapshot_size = 0
+
+    def take_snapshot(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size * SNAPSHOT_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.take_snapshot()
+
+    def stop(self) -> tracemalloc.Snapshot:
+        """
+        Stop sampling and get snapshot closest to the peak.
+        """
+        self.stopped.set()
+        self.join()
+        # final check, in case the peak was reached right before stopping
+        self.take_snapshot()
+
+        return self.snapshot
+
+
+def measure_phase(func: Callable[[], Any], top_n: int = TOP_N) -> tuple[Any, dict[str, Any]]:
+    """
+    Call function while tracing allocations. Returns function result and report
+    with traced peak and top allocations near the peak.
+    """
+    tracemalloc.start()
+    snapshotter = PeakSnapshotter()
+    snapshotter.start()
+
+    try:
+        result = func()
+    finally:
+        snapshot = snapshotter.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    report = {
+        'tracemalloc_peak': peak,
+        'top': tracemalloc_stats(snapshot, top_n=top_n) if snapshot is not None else [],
+    }
+
+    return result, report
+
+
+def _measure_day(day: int, file_path: str, parts: tuple[int, ...], top_n: int) -> dict[str, Any]:
+    """
+    Measure memory of a day in the current process. Meant to be run in a fresh
+    process, as peak RSS never decreases over the lifetime of a process.
+    """
+    solver = load_solver(day)
+    # resident memory of interpreter and imported modules
+    baseline_rss = peak_rss()
+
+    # untraced run first, as tracemalloc bookkeeping itself inflates resident memory
+    data = solver.parse(file_path)
+    for part in parts:
+        getattr(solver, f'part{part}')(data)
+
+    solve_rss = peak_rss()
+    del data
+
+    data, parse_report = measure_phase(lambda: solver.parse(file_path), top_n=top_n)
+    phases = {
+        'parse': parse_report,
+    }
+
+    for part in parts:
+        solve = getattr(solver, f'part{part}')
+        _, phases[f'part{part}'] = measure_phase(lambda: solve(data), top_n=top_n)
+
+    return {
+        'baseline_rss': baseline_rss,
+        'peak_rss': solve_rss,
+        'phases': phases,
+    }
+
+
+def measure_day(
+    day: int,
+    file_path: str,
+    parts: Iterable[int] = (1, 2),
+    top_n: int = TOP_N,
+) -> dict[str, Any]:
+    """
+    Measure peak RSS and traced allocations of parsing and solving given parts of a
+    day, in a freshly spawned process so other days and runs don't skew the peak.
+    """
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(_measure_day, day, file_path, tuple(parts), top_n).result()
+
+
+def _format_bytes(n: int | None) -> str:
+    return f'{n / 1e6:.1f} MB' if n is not None else '-'
+
+
+def format_memory(memory: dict[str, Any]) -> str:
+    """
+    Format memory measurement of a day into single human readable line.
+    """
+    phases = ', '.join(
+        f'{phase} {_format_bytes(report["tracemalloc_peak"])}' for phase, report in memory['phases'].items()
+    )
+
+    return (
+        f'peak RSS {_format_bytes(memory["peak_rss"])} (baseline {_format_bytes(memory["baseline_rss"])}), '
+        f'traced peaks: {phases}'
+    )
@@ -0,0 +1,151 @@
+import os
+import json
+import time
+import pstats
+import cProfile
+import platform
+import tracemalloc
+from typing import Any, Callable, Iterable
+
+from aoc import instrumentation
+from aoc.solvers import ROOT_DIR, load_solver
+
+
+# default directory profile reports are written to
+PROFILES_DIR = os.path.join(ROOT_DIR, 'profiles')
+# number of entries kept in cProfile and tracemalloc listings
+TOP_N = 25
+
+
+def _cprofile_stats(profile: cProfile.Profile, top_n: int = TOP_N) -> list[dict[str, Any]]:
+    """
+    Get functions with highest cumulative time from cProfile results.
+    """
+    stats = pstats.Stats(profile)
+    entries = []
+    for (filename, line, function), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        entries.append({
+            'function': f'{os.path.relpath(filename, ROOT_DIR) if os.path.isabs(filename) else filename}:{line}({function})',
+            'ncalls': ncalls,
+            'tottime': tottime,
+            'cumtime': cumtime,
+        })
+
+    entries.sort(key=lambda entry: entry['cumtime'], reverse=True)
+
+    return entries[:top_n]
+
+
+def tracemalloc_stats(snapshot: tracemalloc.Snapshot, top_n: int = TOP_N) -> list[dict[str, Any]]:
+    """
+    Get source lines with largest allocations still alive in tracemalloc snapshot.
+    """
+    entries = []
+    for stat in snapshot.statistics('lineno')[:top_n]:
+        frame = stat.traceback[0]
+        entries.append({
+            'location': f'{os.path.relpath(frame.filename, ROOT_DIR) if os.path.isabs(frame.filename) else frame.filename}:{frame.lineno}',
+            'size': stat.size,
+            'count': stat.count,
+        })
+
+    return entries
+
+
+def profile_phase(
+    func: Callable[[], Any],
+    use_cprofile: bool = False,
+    use_tracemalloc: bool = False,
+) -> tuple[Any, dict[str, Any]]:
+    """
+    Call function while recording instrumentation counters and timers, and
+    optionally cProfile and tracemalloc data. Returns function result and report.
+    """
+    instrumentation.reset()
+    instrumentation.enable()
+    if use_tracemalloc:
+        tracemalloc.start()
+
+    profile = cProfile.Profile() if use_cprofile else None
+
+    start = time.perf_counter()
+    try:
+        if profile is not None:
+            result = profile.runcall(func)
+        else:
+            result = func()
+    finally:
+        elapsed = time.perf_counter() - start
+        instrumentation.disable()
+
+    report = {'time': elapsed}
+    report.update(instrumentation.snapshot())
+
+    if profile is not None:
+        report['cprofile'] = _cprofile_stats(profile)
+
+    if use_tracemalloc:
+        current, peak = tracemalloc.get_traced_memory()
+        report['tracemalloc'] = {
+            'current': current,
+            'peak': peak,
+            'top': tracemalloc_stats(tracemalloc.take_snapshot()),
+        }
+        tracemalloc.stop()
+
+    return result, report
+
+
+def profile_day(
+    day: int,
+    parts: Iterable[int] = (1, 2),
+    file_path: str | None = None,
+    use_cprofile: bool = False,
+    use_tracemalloc: bool = False,
+) -> dict[str, Any]:
+    """
+    Profile parsing and solving of given parts of a day, with a report per phase.
+    """
+    solver = load_solver(day)
+    if file_path is None:
+        file_path = solver.INPUT_FILE_PATH
+
+    data, parse_report = profile_phase(
+        lambda: solver.parse(file_path),
+        use_cprofile=use_cprofile,
+        use_tracemalloc=use_tracemalloc,
+    )
+
+    report = {
+        'day': day,
+        'file_path': file_path,
+        'input_bytes': os.path.getsize(file_path),
+        'python_version': platform.python_version(),
+        'phases': {
+            'parse': parse_report,
+        },
+    }
+
+    for part in parts:
+        solve = getattr(solver, f'part{part}')
+        answer, part_report = profile_phase(
+            lambda: solve(data),
+            use_cprofile=use_cprofile,
+            use_tracemalloc=use_tracemalloc,
+        )
+        part_report['answer'] = str(answer)
+        report['phases'][f'part{part}'] = part_report
+
+    return report
+
+
+def write_profile(report: dict[str, Any], profiles_dir: str = PROFILES_DIR) -> str:
+    """
+    Write profile report of a day as JSON and return written file path.
+    """
+    os.makedirs(profiles_dir, exist_ok=True)
+    file_path = os.path.join(profiles_dir, f'day_{report["day"]}.json')
+    with open(file_path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    return file_path
@@ -0,0 +1,104 @@
+import os
+import mmap
+from contextlib import contextmanager
+from typing import Iterator
+
+
+# default number of characters read at a time by chunked readers
+CHUNK_SIZE = 1 << 16
+
+
+def read_lines(file_path: str) -> Iterator[str]:
+    """
+    Lazily read lines of file without line endings. Only one line is held in memory
+    at a time.
+    """
+    with open(file_path) as f:
+        for line in f:
+            yield line.rstrip('\r\n')
+
+
+def read_records(file_path: str) -> Iterator[list[str]]:
+    """
+    Lazily read records of file, where records are groups of lines separated by one
+    or more blank lines. Only one record is held in memory at a time.
+    """
+    record = []
+    for line in read_lines(file_path):
+        # blank line ends current record
+        if len(line.strip()) == 0:
+            if len(record) > 0:
+                yield record
+                record = []
+
+            continue
+
+        record.append(line)
+
+    if len(record) > 0:
+        yield record
+
+
+def read_chars(file_path: str, width: int = 1, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Lazily read file as consecutive strings of given width, ignoring line endings.
+    The last string may be shorter than width. Only one chunk is held in memory at a
+    time.
+    """
+    if width < 1:
+        raise ValueError(f'invalid width {width}')
+
+    # characters left over from previous chunk
+    remainder = ''
+    with open(file_path) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if len(chunk) == 0:
+                break
+
+            chunk = remainder + chunk.replace('\r', '').replace('\n', '')
+            n_full = len(chunk) - (len(chunk) % width)
+            for i in range(0, n_full, width):
+                yield chunk[i : i + width]
+
+            remainder = chunk[n_full:]
+
+    if len(remainder) > 0:
+        yield remainder
+
+
+@contextmanager
+def map_bytes(file_path: str) -> Iterator[mmap.mmap | bytes]:
+    """
+    Memory-map file as read-only bytes, which supports slicing, searching and the
+    buffer protocol without reading the whole file into memory. Empty files, which
+    cannot be mapped, are given as empty bytes.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def line_chunks(buffer: mmap.mmap | bytes, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[int, int]]:
+    """
+    Split buffer into consecutive (start, end) byte ranges of about chunk_size bytes,
+    each ending right after a newline, so no line is split across ranges. Lines
+    longer than chunk_size are given a range of their own.
+    """
+    start = 0
+    while start < len(buffer):
+        limit = start + chunk_size
+        if limit >= len(buffer):
+            end = len(buffer)
+        else:
+            end = buffer.rfind(b'\n', start, limit) + 1
+            # line longer than a whole chunk is extended to its end
+            if end <= start:
+                end = buffer.find(b'\n', limit) + 1 or len(buffer)
+
+        yield start, end
+        start = end
@@ -0,0 +1,288 @@
+import os
+import sys
+import json
+import argparse
+from typing import Any
+
+from aoc.benchmark import BENCHMARKS_DIR, INPUTS_DIR, RESULTS_FILE_PATH, benchmark_day, calibrate, run_benchmarks
+
+
+# default committed baseline benchmark results
+BASELINE_FILE_PATH = os.path.join(BENCHMARKS_DIR, 'baseline.json')
+# default allowed relative slowdown before a stage counts as regressed
+DEFAULT_TOLERANCE = 0.5
+# slowdowns smaller than this many seconds are treated as timing noise
+MIN_TIME_DELTA = 0.02
+# number of times days with slower stages are rerun before the slowdown is reported,
+# so one-off hiccups of a loaded machine don't fail the gate
+CONFIRM_RERUNS = 2
+
+
+def get_tolerance(baseline: dict[str, Any], day: str) -> float:
+    """
+    Get allowed relative slowdown of day, falling back to the baseline default.
+    """
+    return baseline.get('tolerances', {}).get(day, baseline.get('tolerance', DEFAULT_TOLERANCE))
+
+
+def machine_speed_ratio(baseline: dict[str, Any], current: dict[str, Any]) -> float:
+    """
+    Get ratio of calibration times of current and baseline runs, by which baseline
+    times are scaled before comparing, so a slower or busier machine doesn't count as
+    a regression. Defaults to 1 if either run was not calibrated.
+    """
+    baseline_calibration = baseline.get('calibration_time')
+    current_calibration = current.get('calibration_time')
+    if not baseline_calibration or not current_calibration:
+        return 1.0
+
+    return current_calibration / baseline_calibration
+
+
+def _stages(run: dict[str, Any]) -> dict[str, tuple[float, str | None]]:
+    """
+    Get time and answer of every stage in a benchmark run.
+    """
+    stages = {'parse': (run['parse_time'], None)}
+    for part, result in run['parts'].items():
+        stages[f'part{part}'] = (result['solve_time'], result['answer'])
+
+    return stages
+
+
+def compare_benchmarks(baseline: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Compare current benchmark results against baseline. Returns list of failures,
+    either stages slower than the day's tolerance allows, changed answers, higher peak
+    memory, or runs missing from current results. Times are compared relative to the
+    calibration of the machine each run was recorded on.
+    """
+    failures = []
+    speed_ratio = machine_speed_ratio(baseline, current)
+
+    for day, day_baseline in baseline['days'].items():
+        tolerance = get_tolerance(baseline, day)
+        current_runs = {run['scale']: run for run in current['days'].get(day, {}).get('runs', [])}
+
+        for baseline_run in day_baseline['runs']:
+            scale = baseline_run['scale']
+            if scale not in current_runs:
+                failures.append({'day': day, 'scale': scale, 'stage': None, 'kind': 'missing'})
+                continue
+
+            current_run = current_runs[scale]
+            current_stages = _stages(current_run)
+
+            for stage, (recorded_time, baseline_answer) in _stages(baseline_run).items():
+                baseline_time = recorded_time * speed_ratio
+
+                if stage not in current_stages:
+                    failures.append({'day': day, 'scale': scale, 'stage': stage, 'kind': 'missing'})
+                    continue
+
+                current_time, current_answer = current_stages[stage]
+
+                if baseline_answer is not None and current_answer != baseline_answer:
+                    failures.append({
+                        'day': day,
+                        'scale': scale,
+                        'stage': stage,
+                        'kind': 'answer',
+                        'baseline': baseline_answer,
+                        'current': current_answer,
+                    })
+
+                if current_time > baseline_time * (1 + tolerance) and current_time - baseline_time > MIN_TIME_DELTA:
+                    failures.append({
+                        'day': day,
+                        'scale': scale,
+                        'stage': stage,
+                        'kind': 'time',
+                        'baseline': baseline_time,
+                        'current': current_time,
+                        'tolerance': tolerance,
+                    })
+
+            # peak memory is only compared if both runs measured it
+            baseline_rss = baseline_run.get('memory', {}).get('peak_rss')
+            current_rss = current_run.get('memory', {}).get('peak_rss')
+            if baseline_rss is not None and current_rss is not None and current_rss > baseline_rss * (1 + tolerance):
+                failures.append({
+                    'day': day,
+                    'scale': scale,
+                    'stage': None,
+                    'kind': 'memory',
+                    'baseline': baseline_rss,
+                    'current': current_rss,
+                    'tolerance': tolerance,
+                })
+
+    return failures
+
+
+def rerun_baseline(baseline: dict[str, Any], inputs_dir: str = INPUTS_DIR) -> dict[str, Any]:
+    """
+    Run benchmarks with the same settings the baseline was recorded with. Scales and
+    parts are taken from each day's baseline runs, so slow days can be recorded at
+    fewer scales or parts than the rest.
+    """
+    current = run_benchmarks(
+        days=[],
+        scales=baseline['scales'],
+        parts=baseline['parts'],
+        repeat=baseline['repeat'],
+        seed=baseline['seed'],
+        inputs_dir=inputs_dir,
+        memory=baseline.get('memory', False),
+    )
+
+    for day, day_baseline in baseline['days'].items():
+        runs = day_baseline['runs']
+        current['days'][day] = benchmark_day(
+            int(day),
+            scales=[run['scale'] for run in runs],
+            parts=[int(part) for part in runs[0]['parts']] if len(runs) > 0 else baseline['parts'],
+            repeat=baseline['repeat'],
+            seed=baseline['seed'],
+            inputs_dir=inputs_dir,
+            memory=baseline.get('memory', False),
+        )
+
+    return current
+
+
+def confirm_failures(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    failures: list[dict[str, Any]],
+    inputs_dir: str = INPUTS_DIR,
+    reruns: int = CONFIRM_RERUNS,
+) -> list[dict[str, Any]]:
+    """
+    Rerun days with slower stages, keeping the fastest time of every stage across
+    runs in current results, and compare again. Only slowdowns that persist across
+    all reruns are kept.
+    """
+    for _ in range(reruns):
+        slow_days = sorted(set(failure['day'] for failure in failures if failure['kind'] == 'time'))
+        if len(slow_days) == 0:
+            break
+
+        rerun = rerun_baseline({**baseline, 'days': {day: baseline['days'][day] for day in slow_days}}, inputs_dir=inputs_dir)
+        # machine may have been busier or quieter than during the first run
+        current['calibration_time'] = min(current.get('calibration_time') or float('inf'), calibrate())
+
+        for day in slow_days:
+            rerun_runs = {run['scale']: run for run in rerun['days'][day]['runs']}
+            for run in current['days'][day]['runs']:
+                if run['scale'] not in rerun_runs:
+                    continue
+
+                rerun_run = rerun_runs[run['scale']]
+                run['parse_time'] = min(run['parse_time'], rerun_run['parse_time'])
+                for part, result in run['parts'].items():
+                    if part in rerun_run['parts']:
+                        result['solve_time'] = min(result['solve_time'], rerun_run['parts'][part]['solve_time'])
+
+        failures = compare_benchmarks(baseline, current)
+
+    return failures
+
+
+def format_failures(failures: list[dict[str, Any]]) -> str:
+    """
+    Format comparison failures into human readable diff.
+    """
+    lines = []
+    for failure in failures:
+        where = f'day {failure["day"]} x{failure["scale"]}'
+        if failure['stage'] is not None:
+            where += f' {failure["stage"]}'
+
+        if failure['kind'] == 'missing':
+            lines.append(f'{where}: missing from current results')
+        elif failure['kind'] == 'answer':
+            lines.append(f'{where}: answer changed\n  - {failure["baseline"]}\n  + {failure["current"]}')
+        elif failure['kind'] == 'time':
+            ratio = failure['current'] / failure['baseline'] if failure['baseline'] > 0 else float('inf')
+            lines.append(
+                f'{where}: {failure["baseline"] * 1000:.3f} ms -> {failure["current"] * 1000:.3f} ms '
+                f'({ratio:.2f}x, tolerance {1 + failure["tolerance"]:.2f}x)'
+            )
+        elif failure['kind'] == 'memory':
+            lines.append(
+                f'{where}: peak RSS {failure["baseline"] / 1e6:.1f} MB -> {failure["current"] / 1e6:.1f} MB '
+                f'(tolerance {1 + failure["tolerance"]:.2f}x)'
+            )
+
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog='python -m aoc.regression',
+        description='Run benchmarks and compare them against a stored baseline, failing on regressions.',
+    )
+    parser.add_argument('-b', '--baseline', default=BASELINE_FILE_PATH, help='baseline JSON file')
+    parser.add_argument('-d', '--day', type=int, nargs='+', dest='days', help='days to check, defaults to all days in baseline')
+    parser.add_argument('--inputs-dir', default=INPUTS_DIR, help='directory to cache generated inputs in')
+    parser.add_argument('-o', '--output', default=RESULTS_FILE_PATH, help='file to write JSON results of current run to')
+    parser.add_argument(
+        '--update',
+        action='store_true',
+        help='write current run as new baseline, keeping tolerances, instead of comparing',
+    )
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.baseline):
+        parser.error(f'baseline {args.baseline} not found, create one with python -m aoc.benchmark -o {args.baseline}')
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    if args.days is not None:
+        baseline['days'] = {day: v for day, v in baseline['days'].items() if int(day) in args.days}
+
+    current = rerun_baseline(baseline, inputs_dir=args.inputs_dir)
+    failures = [] if args.update else confirm_failures(
+        baseline,
+        current,
+        compare_benchmarks(baseline, current),
+        inputs_dir=args.inputs_dir,
+    )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(current, f, indent=2)
+
+    if args.update:
+        # only rerun days are replaced, other days and tolerances are kept
+        with open(args.baseline) as f:
+            updated = json.load(f)
+
+        updated['python_version'] = current['python_version']
+        updated['machine'] = current['machine']
+        # rerun days are rescaled to the calibration the other days were recorded at
+        if 'calibration_time' in updated:
+            ratio = 1 / machine_speed_ratio(updated, current)
+            for day_current in current['days'].values():
+                for run in day_current['runs']:
+                    run['parse_time'] *= ratio
+                    for result in run['parts'].values():
+                        result['solve_time'] *= ratio
+        else:
+            updated['calibration_time'] = current['calibration_time']
+
+        updated['days'].update(current['days'])
+        with open(args.baseline, 'w') as f:
+            json.dump(updated, f, indent=2)
+
+        print(f'Updated baseline {args.baseline}')
+        sys.exit(0)
+
+    if len(failures) > 0:
+        print(f'{len(failures)} regressions against {args.baseline}:')
+        print(format_failures(failures))
+        sys.exit(1)
+
+    print(f'No regressions against {args.baseline}')
@@ -0,0 +1,87 @@
+import time
+from typing import Any, Iterable
+
+from aoc.cache import cached_parse
+from aoc.solvers import find_days, load_solver
+
+
+def run_day(
+    day: int,
+    parts: Iterable[int] = (1, 2),
+    file_path: str | None = None,
+    use_cache: bool = False,
+) -> dict[str, Any]:
+    """
+    Parse input file and solve given parts of a day, timing parsing and solving
+    separately. Uses the day's own input file if no file path is given. If use_cache
+    is True, parsed input is loaded from and stored in the on-disk cache.
+    """
+    solver = load_solver(day)
+    if file_path is None:
+        file_path = solver.INPUT_FILE_PATH
+
+    # time parsing of input file
+    start = time.perf_counter()
+    if use_cache:
+        data, cache_hit = cached_parse(day, file_path)
+    else:
+        data, cache_hit = solver.parse(file_path), False
+
+    parse_time = time.perf_counter() - start
+
+    result = {
+        'day': day,
+        'file_path': file_path,
+        'parse_time': parse_time,
+        'cache_hit': cache_hit,
+        'parts': {},
+    }
+
+    # time solving of each part
+    for part in parts:
+        solve = getattr(solver, f'part{part}', None)
+        if solve is None:
+            raise ValueError(f'day {day} has no part {part}')
+
+        start = time.perf_counter()
+        answer = solve(data)
+        solve_time = time.perf_counter() - start
+
+        result['parts'][part] = {
+            'answer': answer,
+            'solve_time': solve_time,
+        }
+
+    return result
+
+
+def run_days(
+    days: Iterable[int] | None = None,
+    parts: Iterable[int] = (1, 2),
+    file_path: str | None = None,
+    use_cache: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Run multiple days, defaulting to every day with a Python solution.
+    """
+    if days is None:
+        days = find_days().keys()
+
+    return [run_day(day, parts=parts, file_path=file_path, use_cache=use_cache) for day in days]
+
+
+def format_result(result: dict[str, Any]) -> str:
+    """
+    Format result of a day run into human readable lines.
+    """
+    cached = ', cached' if result.get('cache_hit') else ''
+    lines = [f'Day {result["day"]} (parse: {result["parse_time"] * 1000:.3f} ms{cached})']
+    for part, part_result in result['parts'].items():
+        answer = str(part_result['answer'])
+        # start multi-line answers on their own line
+        if '\n' in answer:
+            answer = '\n' + answer
+
+        lines.append(f'  Part {part} ({part_result["solve_time"] * 1000:.3f} ms): {answer}')
+
+    return '\n'.join(lines)
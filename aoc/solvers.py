@@ -0,0 +1,61 @@
+import os
+import re
+import sys
+import importlib.util
+from types import ModuleType
+
+
+# repository root directory, containing the Day_N directories
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# regex pattern for parsing day directory names, such as "Day_1_Calorie_Counting"
+DAY_DIRNAME_PATTERN = re.compile(r'^Day_(\d+)_(.+)$')
+# cache of already imported solver modules
+_loaded_solvers = {}
+
+
+def find_days(root_dir: str = ROOT_DIR) -> dict[int, str]:
+    """
+    Find day directories with Python solutions and map day numbers to their paths,
+    sorted by day number.
+    """
+    days = {}
+
+    for dirname in os.listdir(root_dir):
+        result = DAY_DIRNAME_PATTERN.search(dirname)
+        # skip directories that are not day directories
+        if result is None:
+            continue
+
+        # skip days without a Python solution
+        day_dir = os.path.join(root_dir, dirname)
+        if not os.path.isfile(os.path.join(day_dir, 'Python', 'main.py')):
+            continue
+
+        days[int(result.group(1))] = day_dir
+
+    return dict(sorted(days.items()))
+
+
+def load_solver(day: int) -> ModuleType:
+    """
+    Import Python solution module of given day. Every solution module exposes
+    INPUT_FILE_PATH, parse, part1 and part2.
+    """
+    if day in _loaded_solvers:
+        return _loaded_solvers[day]
+
+    days = find_days()
+    if day not in days:
+        raise ValueError(f'no Python solution found for day {day}')
+
+    # import module from file path, since day directory names are not valid package names
+    module_path = os.path.join(days[day], 'Python', 'main.py')
+    spec = importlib.util.spec_from_file_location(f'day_{day}', module_path)
+    module = importlib.util.module_from_spec(spec)
+    # register module so objects of its classes can be pickled
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+
+    _loaded_solvers[day] = module
+
+    return module
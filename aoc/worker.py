@@ -0,0 +1,234 @@
+import os
+import sys
+import time
+import argparse
+from typing import Any, Iterable
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+from aoc.batch import _init_worker, _run_job, parse_job
+from aoc.runner import format_result
+from aoc.solvers import ROOT_DIR, find_days
+
+
+# default address warm worker listens on, a named pipe on Windows and a unix socket elsewhere
+if sys.platform == 'win32':
+    DEFAULT_ADDRESS = r'\\.\pipe\aoc-worker'
+else:
+    DEFAULT_ADDRESS = os.path.join(ROOT_DIR, '.cache', 'worker.sock')
+# file with key shared by warm worker and its clients, so only users who can read it
+# can connect and have their requests unpickled
+AUTHKEY_FILE_PATH = os.path.join(ROOT_DIR, '.cache', 'worker.key')
+# number of random bytes in generated keys
+AUTHKEY_SIZE = 32
+
+
+def get_authkey(authkey_file_path: str = AUTHKEY_FILE_PATH, create: bool = False) -> bytes:
+    """
+    Read key shared by warm worker and its clients, generating a new key readable by
+    current user only if it does not exist and create is set.
+    """
+    if create and not os.path.isfile(authkey_file_path):
+        os.makedirs(os.path.dirname(os.path.abspath(authkey_file_path)), exist_ok=True)
+        # written to a temporary file first, so clients never read partial keys
+        tmp_file_path = f'{authkey_file_path}.{os.getpid()}.tmp'
+        fd = os.open(tmp_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(os.urandom(AUTHKEY_SIZE))
+
+        os.replace(tmp_file_path, authkey_file_path)
+
+    with open(authkey_file_path, 'rb') as f:
+        return f.read()
+
+
+def _validate_request(request: Any) -> str | None:
+    """
+    Check request is well formed, returning error if it is not.
+    """
+    if not isinstance(request, dict) or request.get('command') not in ('run', 'shutdown'):
+        return f'invalid request {request!r}'
+
+    if request['command'] == 'run':
+        jobs = request.get('jobs')
+        if not isinstance(jobs, list) or not all(
+            isinstance(job, (list, tuple)) and len(job) == 2 and isinstance(job[0], int) and isinstance(job[1], str)
+            for job in jobs
+        ):
+            return 'jobs must be a list of (day, input file path) pairs'
+
+        parts = request.get('parts')
+        if not isinstance(parts, list) or not all(part in (1, 2) for part in parts):
+            return 'parts must be a list of 1 and 2'
+
+        if not isinstance(request.get('use_cache'), bool):
+            return 'use_cache must be a bool'
+
+    return None
+
+
+def serve(
+    address: str = DEFAULT_ADDRESS,
+    days: Iterable[int] | None = None,
+    authkey_file_path: str = AUTHKEY_FILE_PATH,
+):
+    """
+    Keep a warm interpreter with solvers and their heavy imports loaded, running jobs
+    sent over a local socket or pipe one connection at a time until told to shut down.
+    Only clients holding the shared key can connect, and malformed requests are
+    answered with an error instead of stopping the worker.
+    """
+    if days is None:
+        days = find_days()
+
+    _init_worker(days)
+    authkey = get_authkey(authkey_file_path, create=True)
+
+    if _is_listening(address):
+        raise RuntimeError(f'another warm worker is already listening on {address}')
+
+    if sys.platform != 'win32':
+        os.makedirs(os.path.dirname(os.path.abspath(address)), exist_ok=True)
+        # remove socket left behind by a worker that did not shut down cleanly
+        if os.path.exists(address):
+            os.remove(address)
+
+    with Listener(address, authkey=authkey) as listener:
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, OSError, EOFError):
+                # client without the shared key, or one that hung up while connecting
+                continue
+
+            with conn:
+                try:
+                    request = conn.recv()
+                except Exception:
+                    continue
+
+                error = _validate_request(request)
+                if error is not None:
+                    response = {'status': 'error', 'error': error}
+                elif request['command'] == 'shutdown':
+                    response = {'status': 'ok'}
+                else:
+                    results = [_run_job(tuple(job), tuple(request['parts']), request['use_cache']) for job in request['jobs']]
+                    response = {'status': 'ok', 'results': results}
+
+                # client may have hung up without waiting for the response
+                try:
+                    conn.send(response)
+                except (OSError, EOFError):
+                    pass
+
+                if error is None and request['command'] == 'shutdown':
+                    break
+
+
+def _is_listening(address: str) -> bool:
+    """
+    Check if a warm worker is listening on address, by connecting to it. Sockets left
+    behind by workers that did not shut down cleanly refuse connections.
+    """
+    try:
+        # no key is sent, so a live worker just sees a client failing to authenticate
+        with Client(address):
+            return True
+    except (FileNotFoundError, ConnectionRefusedError):
+        return False
+    except (OSError, EOFError, AuthenticationError):
+        return True
+
+
+def _request(
+    request: dict[str, Any],
+    address: str = DEFAULT_ADDRESS,
+    authkey_file_path: str = AUTHKEY_FILE_PATH,
+) -> dict[str, Any]:
+    """
+    Send request to warm worker and wait for its response.
+    """
+    with Client(address, authkey=get_authkey(authkey_file_path)) as conn:
+        conn.send(request)
+        response = conn.recv()
+
+    if response['status'] != 'ok':
+        raise RuntimeError(response['error'])
+
+    return response
+
+
+def submit(
+    jobs: Iterable[tuple[int, str]],
+    parts: Iterable[int] = (1, 2),
+    use_cache: bool = False,
+    address: str = DEFAULT_ADDRESS,
+    authkey_file_path: str = AUTHKEY_FILE_PATH,
+) -> list[dict[str, Any]]:
+    """
+    Run (day, input file path) jobs on warm worker. Results are returned in the same
+    order as the jobs.
+    """
+    response = _request(
+        {
+            'command': 'run',
+            'jobs': list(jobs),
+            'parts': list(parts),
+            'use_cache': use_cache,
+        },
+        address=address,
+        authkey_file_path=authkey_file_path,
+    )
+
+    return response['results']
+
+
+def shutdown(address: str = DEFAULT_ADDRESS, authkey_file_path: str = AUTHKEY_FILE_PATH):
+    """
+    Tell warm worker to stop.
+    """
+    _request({'command': 'shutdown'}, address=address, authkey_file_path=authkey_file_path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog='python -m aoc.worker',
+        description='Keep a warm interpreter with solvers loaded and run jobs on it over a local socket or pipe.',
+    )
+    parser.add_argument('-a', '--address', default=DEFAULT_ADDRESS, help='socket or pipe address of warm worker')
+    parser.add_argument('-k', '--authkey-file', default=AUTHKEY_FILE_PATH, help='file with key shared by warm worker and its clients')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help='start warm worker')
+    serve_parser.add_argument('-d', '--day', type=int, nargs='+', dest='days', help='days to preload, defaults to all days')
+
+    run_parser = subparsers.add_parser('run', help='run jobs on warm worker')
+    run_parser.add_argument('jobs', nargs='+', help='jobs given as DAY:PATH')
+    run_parser.add_argument('-p', '--part', type=int, nargs='+', dest='parts', choices=(1, 2), default=[1, 2], help='parts to solve')
+    run_parser.add_argument('-c', '--cache', action='store_true', help='load and store parsed inputs in on-disk cache')
+
+    subparsers.add_parser('shutdown', help='stop warm worker')
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        serve(args.address, days=args.days, authkey_file_path=args.authkey_file)
+    elif args.command == 'shutdown':
+        shutdown(args.address, authkey_file_path=args.authkey_file)
+    else:
+        try:
+            jobs = [parse_job(job) for job in args.jobs]
+        except ValueError as e:
+            parser.error(str(e))
+
+        start = time.perf_counter()
+        results = submit(jobs, parts=args.parts, use_cache=args.cache, address=args.address, authkey_file_path=args.authkey_file)
+        total_time = time.perf_counter() - start
+
+        for result in results:
+            if 'error' in result:
+                print(f'Day {result["day"]} ({result["file_path"]}) failed:\n{result["error"]}')
+            else:
+                print(format_result(result))
+
+        print(f'Total: {len(results)} jobs in {total_time * 1000:.3f} ms')
@@ -67,3 +67,38 @@ if __name__ == '__main__':
             language_badges = ' '.join([f'[![]({SHIELDS_IO_BADGE_URL}/{LANGUAGE_LOGOS[lang]})]({dirname}/{lang}/{LANGUAGE_FILENAMES[lang]})' for lang in languages])
 
             readme_file.write(f'{day_num} | {puzzle_link} | {language_badges}\n')
+
+        readme_file.write('\n## Running Python Solutions\n\n')
+        readme_file.write(
+            'Every Python solution exposes `parse`, `part1` and `part2` functions and can be imported and timed '
+            'through the `aoc` runner. From the repository root:\n\n'
+        )
+        readme_file.write('```bash\n')
+        readme_file.write('# run and time all days\n')
+        readme_file.write('python -m aoc\n')
+        readme_file.write('# run part 2 of day 14 on a custom input file\n')
+        readme_file.write('python -m aoc --day 14 --part 2 --input path/to/rocks.txt\n')
+        readme_file.write('# reuse parsed inputs cached on disk, keyed by input contents and solution source\n')
+        readme_file.write('python -m aoc --cache\n')
+        readme_file.write('# write per-phase JSON profiles with hot path counters, cProfile and tracemalloc data to profiles/\n')
+        readme_file.write('python -m aoc --profile --day 14 17 --cprofile --tracemalloc\n')
+        readme_file.write('# run batch of DAY:PATH jobs across 4 worker processes\n')
+        readme_file.write('python -m aoc.batch --workers 4 1:a/calories.txt 1:b/calories.txt 8:trees.txt\n')
+        readme_file.write('# keep a warm worker with solvers and numpy loaded, and run jobs on it without paying startup costs\n')
+        readme_file.write('python -m aoc.worker serve &\n')
+        readme_file.write('python -m aoc.worker run 8:trees.txt 14:rocks.txt\n')
+        readme_file.write('python -m aoc.worker shutdown\n')
+        readme_file.write('```\n\n')
+        readme_file.write(
+            'Solutions can be benchmarked on generated inputs of increasing scale, with results, including '
+            'throughput and scaling exponents, written to `benchmarks/results.json`:\n\n'
+        )
+        readme_file.write('```bash\n')
+        readme_file.write('python -m aoc.benchmark --day 1 7 13 --scale 1 100 10000\n')
+        readme_file.write('# also measure peak RSS and top traced allocations of each day at each scale\n')
+        readme_file.write('python -m aoc.benchmark --day 9 17 18 --scale 1 10 --memory\n')
+        readme_file.write('# rerun benchmarks recorded in benchmarks/baseline.json, exiting non-zero on regressions\n')
+        readme_file.write('python -m aoc.regression\n')
+        readme_file.write('# rerun and record new baseline for given days, keeping tolerances\n')
+        readme_file.write('python -m aoc.regression --day 14 --update\n')
+        readme_file.write('```\n')